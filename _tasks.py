@@ -8,6 +8,10 @@ import toml
 
 HERE = Path(__file__).parent
 
+# taken from:
+# https://stackoverflow.com/questions/57108712/replace-updated-version-strings-in-files-via-python
+VERSION_RE = re.compile(r"(^_*?version_*?\s*=\s*\")(\d+\.\d+\.\d+-?\S*)\"", re.M)
+
 
 def task_docs():
     """Build the html docs using Sphinx."""
@@ -21,20 +25,10 @@ def task_docs():
 
 
 def update_version_strings(file_path, new_version):
-    # taken from:
-    # https://stackoverflow.com/questions/57108712/replace-updated-version-strings-in-files-via-python
-    version_regex = re.compile(r"(^_*?version_*?\s*=\s*\")(\d+\.\d+\.\d+-?\S*)\"", re.M)
-    with open(file_path, "r+") as f:
-        content = f.read()
-        f.seek(0)
-        f.write(
-            re.sub(
-                version_regex,
-                lambda match: f'{match.group(1)}{new_version}"',
-                content,
-            )
-        )
-        f.truncate()
+    # A plain replacement string (instead of a callback) lets `re` substitute without calling back into Python.
+    repl = rf'\g<1>{new_version}"'
+    file_path = Path(file_path)
+    file_path.write_text(VERSION_RE.sub(repl, file_path.read_text()))
 
 
 def update_version(version):
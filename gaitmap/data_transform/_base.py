@@ -3,7 +3,9 @@ from copy import copy
 from functools import reduce
 from typing import List, Sequence, Set, Tuple, Union
 
+import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from tpcp import OptimizableParameter, PureParameter
 from typing_extensions import Self
 
@@ -76,6 +78,11 @@ class GroupedTransformer(BaseTransformer, TrainableTransformerMixin):
         If `True`, columns that are not mentioned as keys in the `transformer_mapping`, will be added to the output
         unchanged.
         Otherwise, only columns that are actually transformed remain in the output.
+    n_jobs
+        The number of threads used to transform the individual column groups in parallel.
+        As all groups are independent, this can speed up the transformation for mappings with many groups and
+        transformers that release the GIL (e.g. most numpy based operations).
+        By default, all groups are transformed sequentially.
 
     Attributes
     ----------
@@ -91,6 +98,7 @@ class GroupedTransformer(BaseTransformer, TrainableTransformerMixin):
 
     transformer_mapping: OptimizableParameter[List[Tuple[Union[_Hashable, Tuple[_Hashable, ...]], BaseTransformer]]]
     keep_all_cols: PureParameter[bool]
+    n_jobs: PureParameter[int]
 
     data: SingleSensorData
 
@@ -98,9 +106,11 @@ class GroupedTransformer(BaseTransformer, TrainableTransformerMixin):
         self,
         transformer_mapping: List[Tuple[Union[_Hashable, Tuple[_Hashable, ...]], BaseTransformer]],
         keep_all_cols: bool = True,
+        n_jobs: int = 1,
     ):
         self.transformer_mapping = transformer_mapping
         self.keep_all_cols = keep_all_cols
+        self.n_jobs = n_jobs
 
     def self_optimize(self, data: Sequence[SingleSensorData], **kwargs) -> Self:
         """Train all trainable transformers based on the provided data.
@@ -165,24 +175,41 @@ class GroupedTransformer(BaseTransformer, TrainableTransformerMixin):
         self.data = data
         mapped_cols = self._validate_mapping()
         self._validate(data, mapped_cols)
-        results = []
-        mapping = self.transformer_mapping
+
+        def _transform_group(
+            cols: Tuple[_Hashable, ...], transformer: BaseTransformer, group_data: SingleSensorData
+        ) -> SingleSensorData:
+            # We clone here to make sure that we do not modify the "parameters" within the action method
+            tmp = transformer.clone().transform(group_data, **kwargs).transformed_data_
+            # We only keep the columns of the group (in case the transformer adds additional ones) and collect one
+            # dataframe per group instead of one per column to keep the final concat cheap.
+            return tmp[list(cols)]
+
+        groups = [(k if isinstance(k, tuple) else (k,), v) for k, v in self.transformer_mapping]
+        if data.columns.is_unique:
+            # We resolve the column labels of all groups with a single index lookup and then select the data of each
+            # group by position.
+            flat_positions = data.columns.get_indexer([c for cols, _ in groups for c in cols])
+            group_positions = np.split(flat_positions, np.cumsum([len(cols) for cols, _ in groups])[:-1])
+            group_data = [data.iloc[:, positions] for positions in group_positions]
+        else:
+            group_data = [data[list(cols)] for cols, _ in groups]
+        # The groups operate on disjoint columns, so they can be transformed independently in multiple threads.
+        results = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(_transform_group)(k, v, d) for (k, v), d in zip(groups, group_data)
+        )
         if self.keep_all_cols:
-            mapping = [*mapping, *((k, IdentityTransformer()) for k in set(data.columns) - mapped_cols)]
+            # All columns that are not mapped are passed through unchanged (as one block).
+            passthrough_cols = [c for c in data.columns if c not in mapped_cols]
+            if passthrough_cols:
+                results.append(data[passthrough_cols])
             mapped_cols = set(data.columns)
-        for k, v in mapping:
-            if not isinstance(k, tuple):
-                k = (k,)
-            # We clone here to make sure that we do not modify the "parameters" within the action method
-            tmp = v.clone().transform(data[list(k)], **kwargs).transformed_data_
-            for col in k:
-                results.append(tmp[[col]])
-        self.transformed_data_ = pd.concat(results, axis=1)[sorted(mapped_cols, key=list(data.columns).index)]
+        self.transformed_data_ = pd.concat(results, axis=1)[[c for c in data.columns if c in mapped_cols]]
         return self
 
     def _validate_mapping(self) -> Set[_Hashable]:
         # Check that each column is only mentioned once:
-        unique_k = []
+        unique_k = set()
         for k, _ in self.transformer_mapping:
             if not isinstance(k, tuple):
                 k = (k,)
@@ -192,8 +219,8 @@ class GroupedTransformer(BaseTransformer, TrainableTransformerMixin):
                         "Each column name must only be mentioned once in the keys of `scaler_mapping`."
                         "Applying multiple transformations to the same column is not supported."
                     )
-                unique_k.append(i)
-        return set(unique_k)
+                unique_k.add(i)
+        return unique_k
 
     def _validate(self, data: SingleSensorData, selected_cols: Set[_Hashable]):
         if not set(data.columns).issuperset(selected_cols):
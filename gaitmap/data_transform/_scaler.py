@@ -2,6 +2,8 @@
 from typing import Optional, Sequence, Tuple
 
 import numpy as np
+import pandas as pd
+from numba import njit, prange
 from tpcp import OptimizableParameter, Parameter
 from typing_extensions import Self
 
@@ -9,6 +11,86 @@ from gaitmap.data_transform._base import BaseTransformer, TrainableTransformerMi
 from gaitmap.utils.datatype_helper import SensorData, SingleSensorData, is_single_sensor_data
 
 
+def _float_copy(data: SingleSensorData) -> np.ndarray:
+    """Get a float copy of the data values that can be modified in-place.
+
+    Float data keeps its precision (e.g. float32 stays float32), all other data is converted to float64 (like pandas
+    would do for a division).
+    """
+    values = data.to_numpy()
+    dtype = values.dtype if np.issubdtype(values.dtype, np.floating) else np.float64
+    return np.array(values, dtype=dtype, copy=True)
+
+
+def _has_single_numeric_dtype(data: SingleSensorData) -> bool:
+    """Check if all columns share the same numeric dtype, so that the data can be transformed as a single array.
+
+    Otherwise, each column should keep its own dtype, which requires the column-wise operations of pandas.
+    """
+    dtypes = set(data.dtypes)
+    if len(dtypes) != 1:
+        return False
+    dtype = dtypes.pop()
+    return isinstance(dtype, np.dtype) and (np.issubdtype(dtype, np.floating) or np.issubdtype(dtype, np.integer))
+
+
+def _wrap_like(values: np.ndarray, data: SingleSensorData) -> SingleSensorData:
+    return pd.DataFrame(values, index=data.index, columns=data.columns)
+
+
+@njit(parallel=True, cache=True)
+def _nan_abs_max(data: np.ndarray) -> float:
+    """Calculate the maximum of the absolute values of a 2D array ignoring NaNs.
+
+    This is equivalent to `np.nanmax(np.abs(data))`, but does not create a temporary array for the absolute values.
+    If the array only contains NaNs, NaN is returned.
+    """
+    n_rows, n_cols = data.shape
+    row_max = np.full(n_rows, -1.0)
+    for i in prange(n_rows):
+        local_max = -1.0
+        for j in range(n_cols):
+            # Comparisons with NaN are always False, so NaNs are skipped automatically.
+            val = abs(data[i, j])
+            if val > local_max:
+                local_max = val
+        row_max[i] = local_max
+    global_max = -1.0
+    for i in range(n_rows):
+        if row_max[i] > global_max:
+            global_max = row_max[i]
+    if global_max < 0:
+        return np.nan
+    return global_max
+
+
+@njit(parallel=True, cache=True)
+def _nan_min_max(data: np.ndarray) -> Tuple[float, float]:
+    """Calculate the minimum and maximum of a 2D array ignoring NaNs.
+
+    This is equivalent to `(np.nanmin(data), np.nanmax(data))`, but only iterates the data once.
+    If the array only contains NaNs, NaN is returned for both values.
+    """
+    n_rows, n_cols = data.shape
+    # Rows that only contain NaNs keep their initial values (inf, -inf) and are hence ignored in the final reduction.
+    row_min = np.full(n_rows, np.inf)
+    row_max = np.full(n_rows, -np.inf)
+    for i in prange(n_rows):
+        for j in range(n_cols):
+            val = data[i, j]
+            if val < row_min[i]:
+                row_min[i] = val
+            if val > row_max[i]:
+                row_max[i] = val
+    if n_rows == 0:
+        return np.nan, np.nan
+    global_min = row_min.min()
+    global_max = row_max.max()
+    if global_min > global_max:
+        return np.nan, np.nan
+    return global_min, global_max
+
+
 class FixedScaler(BaseTransformer):
     """Apply a fixed scaling and offset to the data.
 
@@ -60,7 +142,16 @@ class FixedScaler(BaseTransformer):
 
         """
         self.data = data
-        self.transformed_data_ = (data - self.offset) / self.scale
+        if not (np.ndim(self.offset) == 0 and np.ndim(self.scale) == 0 and _has_single_numeric_dtype(data)):
+            # Per-column offsets or scales must be aligned by column name and mixed dtypes must be kept per column.
+            self.transformed_data_ = (data - self.offset) / self.scale
+            return self
+        # We only allocate a single output array and apply all operations in-place.
+        transformed = _float_copy(data)
+        dtype = transformed.dtype.type
+        np.subtract(transformed, dtype(self.offset), out=transformed)
+        np.divide(transformed, dtype(self.scale), out=transformed)
+        self.transformed_data_ = _wrap_like(transformed, data)
         return self
 
 
@@ -257,12 +348,18 @@ class AbsMaxScaler(BaseTransformer):
 
     def _get_abs_max(self, data: SingleSensorData) -> float:
         is_single_sensor_data(data, check_gyr=False, check_acc=False, raise_exception=True)
-        return float(np.nanmax(np.abs(data.to_numpy())))
+        return float(_nan_abs_max(data.to_numpy(dtype=np.float64, copy=False)))
 
     def _transform(self, data: SingleSensorData, absmax: float) -> SingleSensorData:
-        data = data.copy()
-        data *= self.out_max / absmax
-        return data
+        if not _has_single_numeric_dtype(data):
+            # Pandas applies the factor per column and hence keeps the dtype of each column.
+            data = data.copy()
+            data *= self.out_max / absmax
+            return data
+        transformed = _float_copy(data)
+        # The factor is cast to the data dtype to keep e.g. float32 data in float32 for the entire calculation.
+        np.multiply(transformed, transformed.dtype.type(self.out_max / absmax), out=transformed)
+        return _wrap_like(transformed, data)
 
 
 class TrainableAbsMaxScaler(AbsMaxScaler, TrainableTransformerMixin):
@@ -422,20 +519,27 @@ class MinMaxScaler(BaseTransformer):
     def _calc_data_range(self, data: SensorData) -> Tuple[float, float]:
         is_single_sensor_data(data, check_gyr=False, check_acc=False, raise_exception=True)
         # We calculate the global min and max over all rows and columns!
-        data = data.to_numpy()
-        return float(np.nanmin(data)), float(np.nanmax(data))
+        data_min, data_max = _nan_min_max(data.to_numpy(dtype=np.float64, copy=False))
+        return float(data_min), float(data_max)
 
     def _transform(self, data: SingleSensorData, data_range: Tuple[float, float]) -> SingleSensorData:
-        data = data.copy()
         feature_range = self.out_range
         data_min, data_max = data_range
         transform_range = (data_max - data_min) or 1.0
         transform_scale = (feature_range[1] - feature_range[0]) / transform_range
         transform_min = feature_range[0] - data_min * transform_scale
 
-        data *= transform_scale
-        data += transform_min
-        return data
+        if not _has_single_numeric_dtype(data):
+            # Pandas applies the scaling per column and hence keeps the dtype of each column.
+            data = data.copy()
+            data *= transform_scale
+            data += transform_min
+            return data
+        transformed = _float_copy(data)
+        dtype = transformed.dtype.type
+        np.multiply(transformed, dtype(transform_scale), out=transformed)
+        np.add(transformed, dtype(transform_min), out=transformed)
+        return _wrap_like(transformed, data)
 
 
 class TrainableMinMaxScaler(MinMaxScaler, TrainableTransformerMixin):
@@ -506,8 +610,8 @@ class TrainableMinMaxScaler(MinMaxScaler, TrainableTransformerMixin):
             The trained instance of the transformer
 
         """
-        mins, maxs = zip(*(self._calc_data_range(d) for d in data))
-        self.data_range = np.min(mins), np.max(maxs)
+        data_ranges = np.array([self._calc_data_range(d) for d in data])
+        self.data_range = data_ranges[:, 0].min(), data_ranges[:, 1].max()
         return self
 
     def transform(self, data: SingleSensorData, **_) -> Self:
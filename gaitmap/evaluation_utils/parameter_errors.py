@@ -1,6 +1,6 @@
 """A helper function to evaluate the output of the temporal or spatial parameter calculation against a ground truth."""
 import warnings
-from typing import Dict, Literal, Tuple, Union
+from typing import Dict, Literal, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -10,6 +10,7 @@ from gaitmap.utils.datatype_helper import set_correct_index
 from gaitmap.utils.exceptions import ValidationError
 
 _ID_COL_NAME = "__id_col__"
+_ERROR_TYPES = frozenset({"error", "abs_error", "rel_error", "abs_rel_error", "predicted", "reference"})
 
 
 def calculate_parameter_errors(
@@ -80,16 +81,15 @@ def calculate_parameter_errors(
         )
 
     if predicted_is_not_dict:
-        predicted_parameter = {"__dummy__": predicted_parameter}
-        reference_parameter = {"__dummy__": reference_parameter}
+        # For a single sensor, we skip the dict handling and directly align and compare the dataframes.
+        aligned, common_rows = _align_single_sensor_parameters(
+            reference_parameter, predicted_parameter, id_column=id_column
+        )
+        return _calculate_single_sensor_error(aligned), common_rows
 
     aligned_parameters, common_rows = _align_parameters(reference_parameter, predicted_parameter, id_column=id_column)
     output = _calculate_error(aligned_parameters)
 
-    if predicted_is_not_dict:
-        output = output["__dummy__"]
-        common_rows = common_rows["__dummy__"]
-
     return output, common_rows
 
 
@@ -398,10 +398,10 @@ def calculate_aggregated_parameter_errors(
 
     Notes
     -----
-    We are using pandas.quantile() to calculate the quantiles.
+    We are using `numpy.nanquantile()` to calculate the quantiles.
     In case the input is NaN/Inf for some values, the quantile function might return NaN/Inf as well.
-    Even if the method returns a value, note, that pandas calculates the quantiles by first removing NaN and then
-    passing them to `numpy.percentile()`.
+    Even if the method returns a value, note, that the quantiles are calculated by first removing NaN and then
+    calculating the percentile of the remaining values (identical to `pandas.DataFrame.quantile()`).
     The result will be different from passing the data to `numpy.percentile()` directly.
     These NaN errors might happen for the relative errors, if the reference parameter is 0.
 
@@ -415,23 +415,25 @@ def calculate_aggregated_parameter_errors(
         # Independent of the `calculate_per_sensor` parameter, we want to return a DataFrame
         return pd.concat([_calculate_error_stats(errors, scoring_errors=scoring_errors), common_rows_stats])
     if calculate_per_sensor is True:
-        return pd.concat(
-            {
-                sensor_name: pd.concat(
-                    [_calculate_error_stats(error_df, scoring_errors=scoring_errors), common_rows_stats[sensor_name]]
-                )
-                for sensor_name, error_df in errors.items()
-            },
-            axis=1,
-        )
+        error_stats = {
+            sensor_name: _calculate_error_stats(error_df, scoring_errors=scoring_errors)
+            for sensor_name, error_df in errors.items()
+        }
+        # We combine all sensors for the error stats and the common rows stats separately and then stack the two
+        # blocks, instead of creating one combined dataframe per sensor first.
+        return pd.concat([pd.concat(error_stats, axis=1), pd.concat(common_rows_stats, axis=1)])
     # If we don't calculate per sensor, we combine the error dfs for all sensors
     combined_errors = pd.concat(errors)
+    # The ids are only unique per sensor, so we combine them with the sensor name.
     combined_errors.index = pd.Index(
-        (f"{sensor_name}_{index}" for sensor_name, index in combined_errors.index), name=_ID_COL_NAME
+        combined_errors.index.get_level_values(0).astype(str)
+        + "_"
+        + combined_errors.index.get_level_values(1).astype(str),
+        name=_ID_COL_NAME,
     )
 
     # And we need to sum up the common rows stats
-    common_rows_stats = pd.concat(common_rows_stats, axis=1).groupby(level=1, axis=1).sum()
+    common_rows_stats = pd.concat(common_rows_stats).groupby(level=1, sort=False).sum().sort_index(axis=1)
     return pd.concat([_calculate_error_stats(combined_errors, scoring_errors=scoring_errors), common_rows_stats])
 
 
@@ -445,71 +447,95 @@ def _align_parameters(reference_parameter, predicted_parameter, id_column):
     meta_error_dict = {}
 
     for sensor in sensor_names_list:
-        try:
-            predicted_parameter_correct = set_correct_index(
-                predicted_parameter[sensor], index_cols=[id_column]
-            ).rename_axis(index={id_column: _ID_COL_NAME})
-            reference_parameter_correct = set_correct_index(
-                reference_parameter[sensor], index_cols=[id_column]
-            ).rename_axis(index={id_column: _ID_COL_NAME})
-        except ValidationError as e:
-            raise ValidationError(
-                f"Predicted and reference need to have either an index or a column named `{id_column}`. "
-                "This column name is controlled by the `id_column` parameter.\n"
-                "In case you are using the `parameter_pretty_` output of the parameter calculation, set this to "
-                "`id_column='stride id'`."
-            ) from e
-
-        common_features = sorted(
-            set(predicted_parameter_correct.keys()).intersection(reference_parameter_correct.keys())
+        aligned_dict[sensor], meta_error_dict[sensor] = _align_single_sensor_parameters(
+            reference_parameter[sensor], predicted_parameter[sensor], id_column=id_column, sensor_name=sensor
         )
 
-        err_msg_start = "No " if sensor == "__dummy__" else f"For sensor {sensor} no "
+    return aligned_dict, meta_error_dict
 
-        if len(common_features) == 0:
-            raise ValidationError(err_msg_start + "common parameter columns are found between predicted and reference.")
 
-        aligned = pd.concat(
-            [predicted_parameter_correct[common_features], reference_parameter_correct[common_features]],
-            axis=1,
-            keys=["predicted", "reference"],
-            names=["source", "parameter"],
+def _align_single_sensor_parameters(
+    reference_parameter: pd.DataFrame,
+    predicted_parameter: pd.DataFrame,
+    id_column: str,
+    sensor_name: Optional[_Hashable] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    try:
+        predicted_parameter_correct = set_correct_index(predicted_parameter, index_cols=[id_column]).rename_axis(
+            index={id_column: _ID_COL_NAME}
         )
+        reference_parameter_correct = set_correct_index(reference_parameter, index_cols=[id_column]).rename_axis(
+            index={id_column: _ID_COL_NAME}
+        )
+    except ValidationError as e:
+        raise ValidationError(
+            f"Predicted and reference need to have either an index or a column named `{id_column}`. "
+            "This column name is controlled by the `id_column` parameter.\n"
+            "In case you are using the `parameter_pretty_` output of the parameter calculation, set this to "
+            "`id_column='stride id'`."
+        ) from e
+
+    common_features = predicted_parameter_correct.columns.intersection(
+        reference_parameter_correct.columns
+    ).sort_values()
+
+    err_msg_start = "No " if sensor_name is None else f"For sensor {sensor_name} no "
+
+    if len(common_features) == 0:
+        raise ValidationError(err_msg_start + "common parameter columns are found between predicted and reference.")
+
+    aligned = pd.concat(
+        [predicted_parameter_correct[common_features], reference_parameter_correct[common_features]],
+        axis=1,
+        keys=["predicted", "reference"],
+        names=["source", "parameter"],
+    )
 
-        max_common = 0
-        common_rows_per_parameter = {}
-        for para in common_features:
-            common = len(aligned.loc[:, pd.IndexSlice[:, para]].dropna(how="any"))
-            max_common = max(common, max_common)
-            common_rows_per_parameter[para] = {
-                "n_common": common,
-                "n_additional_reference": len(reference_parameter_correct[para].dropna()) - common,
-                "n_additional_predicted": len(predicted_parameter_correct[para].dropna()) - common,
-            }
-        meta_error_dict[sensor] = pd.DataFrame(common_rows_per_parameter)
-
-        if max_common == 0:
-            raise ValidationError(err_msg_start + "common entries are found between predicted and reference!")
+    max_common = 0
+    common_rows_per_parameter = {}
+    for para in common_features:
+        common = len(aligned.loc[:, pd.IndexSlice[:, para]].dropna(how="any"))
+        max_common = max(common, max_common)
+        common_rows_per_parameter[para] = {
+            "n_common": common,
+            "n_additional_reference": len(reference_parameter_correct[para].dropna()) - common,
+            "n_additional_predicted": len(predicted_parameter_correct[para].dropna()) - common,
+        }
 
-        aligned_dict[sensor] = aligned
+    if max_common == 0:
+        raise ValidationError(err_msg_start + "common entries are found between predicted and reference!")
 
-    return aligned_dict, meta_error_dict
+    return aligned, pd.DataFrame(common_rows_per_parameter)
 
 
 def _calculate_error(aligned_parameters: Dict[_Hashable, pd.DataFrame]) -> Dict[_Hashable, pd.DataFrame]:
     """Calculate the error between a reference and a predicted parameter."""
-    final_error_dict = {}
-    for k, v in aligned_parameters.items():
-        error_dict = {
-            "predicted": v["predicted"],
-            "reference": v["reference"],
-            "error": v["predicted"] - v["reference"],
-            "abs_error": (v["predicted"] - v["reference"]).abs(),
-            "rel_error": (v["predicted"] - v["reference"]) / v["reference"],
-            "abs_rel_error": ((v["predicted"] - v["reference"]) / v["reference"]).abs(),
-        }
-        final_error_dict[k] = pd.concat(error_dict, axis=1, names=["error_type", "parameter"])
-    return final_error_dict
+    return {k: _calculate_single_sensor_error(v) for k, v in aligned_parameters.items()}
+
+
+def _calculate_single_sensor_error(aligned_parameters: pd.DataFrame) -> pd.DataFrame:
+    """Calculate the error between a reference and a predicted parameter for a single sensor."""
+    predicted = aligned_parameters["predicted"]
+    reference = aligned_parameters["reference"]
+    # After the alignment, both dataframes share the same index and column order.
+    # Hence, we can skip the index alignment of pandas and calculate the error only once on the raw arrays.
+    reference_array = reference.to_numpy()
+    error = predicted.to_numpy() - reference_array
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rel_error = error / reference_array
+
+    def _to_df(values: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(values, index=predicted.index, columns=predicted.columns)
+
+    error_dict = {
+        "predicted": predicted,
+        "reference": reference,
+        "error": _to_df(error),
+        "abs_error": _to_df(np.abs(error)),
+        "rel_error": _to_df(rel_error),
+        "abs_rel_error": _to_df(np.abs(rel_error)),
+    }
+    return pd.concat(error_dict, axis=1, names=["error_type", "parameter"])
 
 
 def _calculate_error_stats(
@@ -517,22 +543,27 @@ def _calculate_error_stats(
     scoring_errors: Literal["ignore", "warn", "raise"] = "warn",
 ) -> pd.DataFrame:
     """Aggregate the error for a single sensor."""
-    assert {"error", "abs_error", "rel_error", "abs_rel_error", "predicted", "reference"} == set(
-        error_df.columns.get_level_values(0)
-    )
+    assert set(error_df.columns.unique(level=0)) == _ERROR_TYPES
     assert error_df.columns.names == ["error_type", "parameter"]
+    # We calculate all stats directly on the underlying array to avoid one pandas reduction per metric.
+    # The nan-versions of the numpy functions mirror the `skipna` behaviour of pandas.
+    error_array = error_df.to_numpy(dtype=float)
+    with warnings.catch_warnings():
+        # All-NaN columns (or columns with a single value for the std) should simply result in NaN
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        # All quantiles are calculated in one call, so that the data only needs to be sorted once.
+        q05, median, q95 = np.nanquantile(error_array, [0.05, 0.5, 0.95], axis=0)
+        stats = {
+            "mean": np.nanmean(error_array, axis=0),
+            "std": np.nanstd(error_array, axis=0, ddof=1),
+            "median": median,
+            "q05": q05,
+            "q95": q95,
+            "max": np.nanmax(error_array, axis=0),
+            "min": np.nanmin(error_array, axis=0),
+        }
     general_stats = (
-        pd.DataFrame(  # noqa: PD010
-            {
-                "mean": error_df.mean(),
-                "std": error_df.std(),
-                "median": error_df.median(),
-                "q05": error_df.quantile(0.05),
-                "q95": error_df.quantile(0.95),
-                "max": error_df.max(),
-                "min": error_df.min(),
-            }
-        )
+        pd.DataFrame(stats, index=error_df.columns)  # noqa: PD010
         .assign(loa_lower=lambda x: x["mean"] - 1.96 * x["std"], loa_upper=lambda x: x["mean"] + 1.96 * x["std"])
         .unstack("error_type")
         .T
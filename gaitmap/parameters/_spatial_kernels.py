@@ -0,0 +1,70 @@
+"""Numba kernels for the per-sample calculations of the spatial parameters.
+
+All kernels expect the samples of each stride to be stored in one contiguous block and get the start of each block
+(plus the total number of samples as last entry) as `offsets`.
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def arc_length_per_stride(positions: np.ndarray, offsets: np.ndarray):
+    """Sum up the distances between consecutive samples of each stride.
+
+    Sample pairs that contain NaN values are ignored.
+    Besides the arc length, the number of valid sample pairs per stride is returned.
+    """
+    n_strides = len(offsets) - 1
+    arc_length = np.zeros(n_strides)
+    n_valid = np.zeros(n_strides, dtype=np.int64)
+    for i in range(n_strides):
+        for j in range(offsets[i] + 1, offsets[i + 1]):
+            squared_dist = 0.0
+            for k in range(positions.shape[1]):
+                diff = positions[j, k] - positions[j - 1, k]
+                squared_dist += diff * diff
+            if not np.isnan(squared_dist):
+                arc_length[i] += np.sqrt(squared_dist)
+                n_valid[i] += 1
+    return arc_length, n_valid
+
+
+@njit(cache=True)
+def _first_valid(values: np.ndarray, start: int, end: int) -> float:
+    for j in range(start, end):
+        if not np.isnan(values[j]):
+            return values[j]
+    return np.nan
+
+
+@njit(cache=True)
+def _last_valid(values: np.ndarray, start: int, end: int) -> float:
+    for j in range(end - 1, start - 1, -1):
+        if not np.isnan(values[j]):
+            return values[j]
+    return np.nan
+
+
+@njit(cache=True, error_model="numpy")
+def max_lateral_excursion_per_stride(pos_x: np.ndarray, pos_y: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Find the maximal distance of the samples of each stride to the line between its first and last sample.
+
+    Like `groupby().first()/.last()`, the line is defined by the first and last non-NaN value of each coordinate.
+    Samples with NaN values are ignored when searching the maximum.
+    """
+    n_strides = len(offsets) - 1
+    max_excursion = np.empty(n_strides)
+    for i in range(n_strides):
+        start = offsets[i]
+        end = offsets[i + 1]
+        start_x = _first_valid(pos_x, start, end)
+        start_y = _first_valid(pos_y, start, end)
+        dx = _last_valid(pos_x, start, end) - start_x
+        dy = _last_valid(pos_y, start, end) - start_y
+        stride_max = np.nan
+        for j in range(start, end):
+            excursion = abs((pos_x[j] - start_x) * dy - dx * (pos_y[j] - start_y))
+            if np.isnan(stride_max) or excursion > stride_max:
+                stride_max = excursion
+        max_excursion[i] = stride_max / np.sqrt(dx * dx + dy * dy)
+    return max_excursion
@@ -1,14 +1,14 @@
 """Calculate spatial parameters algorithm by Kanzler et al. 2015 and Rampp et al. 2014."""
 import warnings
-from typing import Dict, Literal, Optional, Sequence, Union
+from typing import Dict, Literal, NamedTuple, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
 from numpy.linalg import norm
-from scipy.spatial.transform import Rotation
 from typing_extensions import Self
 
 from gaitmap.base import BaseSpatialParameterCalculation
+from gaitmap.parameters._spatial_kernels import arc_length_per_stride, max_lateral_excursion_per_stride
 from gaitmap.parameters._temporal_parameters import _get_stride_time_cols
 from gaitmap.utils._algo_helper import invert_result_dictionary, set_params_from_dict
 from gaitmap.utils._types import _Hashable
@@ -27,7 +27,7 @@ from gaitmap.utils.datatype_helper import (
     set_correct_index,
 )
 from gaitmap.utils.exceptions import ValidationError
-from gaitmap.utils.rotations import find_angle_between_orientations, find_unsigned_3d_angle
+from gaitmap.utils.vector_math import normalize
 
 ParamterNames = Literal[
     "stride_length",
@@ -330,7 +330,8 @@ class SpatialParameterCalculation(BaseSpatialParameterCalculation):
         return {"parameters": parameters, "sole_angle_course": angle_course}
 
     def _traj_based_parameters(self, positions, stride_event_list, sampling_rate_hz):
-        positions = set_correct_index(positions, GF_INDEX)[GF_POS]
+        # We split the positions into strides only once and reuse the result for all parameters.
+        positions = _split_by_stride(set_correct_index(positions, GF_INDEX)[GF_POS])
 
         param_dict = {}
 
@@ -387,12 +388,68 @@ class SpatialParameterCalculation(BaseSpatialParameterCalculation):
         return parameter_name in self.calculate_only
 
 
-def _calc_stride_length(positions: pd.DataFrame) -> pd.Series:
-    start = positions.groupby(level="s_id").first()
-    end = positions.groupby(level="s_id").last()
-    stride_length = end - start
-    stride_length = pd.Series(norm(stride_length[["pos_x", "pos_y"]], axis=1), index=stride_length.index)
-    return stride_length
+class _StrideSplit(NamedTuple):
+    """Stride-wise contiguous representation of a position or orientation list.
+
+    The samples of each stride are stored in one contiguous block of `samples`.
+    The samples of the stride `stride_ids[i]` are `samples[offsets[i]:offsets[i + 1]]`.
+    """
+
+    stride_ids: pd.Index
+    columns: pd.Index
+    samples: np.ndarray
+    offsets: np.ndarray
+
+
+def _split_by_stride(data: pd.DataFrame) -> _StrideSplit:
+    s_ids = data.index.get_level_values("s_id")
+    stride_codes, stride_ids = pd.factorize(s_ids, sort=True)
+    values = data.to_numpy(dtype=float)
+    # Position and orientation lists are usually already sorted by stride.
+    # Only if not, we need to sort them, using a stable sort to keep the order of the samples within each stride.
+    if not s_ids.is_monotonic_increasing:
+        order = np.argsort(stride_codes, kind="stable")
+        stride_codes = stride_codes[order]
+        values = values[order]
+    offsets = np.searchsorted(stride_codes, np.arange(len(stride_ids) + 1))
+    return _StrideSplit(pd.Index(stride_ids, name="s_id"), data.columns, values, offsets)
+
+
+def _as_stride_split(data: Union[pd.DataFrame, _StrideSplit]) -> _StrideSplit:
+    if isinstance(data, _StrideSplit):
+        return data
+    return _split_by_stride(data)
+
+
+def _first_and_last_valid(samples: np.ndarray, offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the first and the last non-NaN value of each column for each stride.
+
+    This is equivalent to `groupby(level="s_id").first()` and `.last()`, i.e. each column is handled independently and
+    strides without any valid value in a column get NaN for this column.
+    """
+    starts, ends = offsets[:-1], offsets[1:]
+    if len(samples) > 0 and not np.isnan(samples).any():
+        # Without NaNs, these are simply the first and the last sample of each stride.
+        return samples[starts], samples[ends - 1]
+    first = np.full((len(starts), samples.shape[1]), np.nan)
+    last = first.copy()
+    for col in range(samples.shape[1]):
+        valid = np.flatnonzero(~np.isnan(samples[:, col]))
+        # Position of the first valid sample at or after the start and of the last valid sample before the end of the
+        # stride in the list of all valid samples.
+        first_valid = np.searchsorted(valid, starts)
+        last_valid = np.searchsorted(valid, ends) - 1
+        has_valid = first_valid <= last_valid
+        first[has_valid, col] = samples[valid[first_valid[has_valid]], col]
+        last[has_valid, col] = samples[valid[last_valid[has_valid]], col]
+    return first, last
+
+
+def _calc_stride_length(positions: Union[SingleSensorPositionList, _StrideSplit]) -> pd.Series:
+    strides = _as_stride_split(positions)
+    floor_plane = strides.samples[:, strides.columns.get_indexer(["pos_x", "pos_y"])]
+    start, end = _first_and_last_valid(floor_plane, strides.offsets)
+    return pd.Series(norm(end - start, axis=1), index=strides.stride_ids)
 
 
 def _get_angle_at_index(angle_course: pd.Series, index_per_stride: pd.Series) -> pd.Series:
@@ -407,23 +464,36 @@ def _calc_turning_angle(orientations: pd.DataFrame) -> pd.Series:
         angles.index.name = "s_id"
         return angles
 
-    start = orientations.groupby(level="s_id").first()
-    end = orientations.groupby(level="s_id").last()
-    angles = pd.Series(
-        np.rad2deg(
-            find_angle_between_orientations(
-                Rotation.from_quat(end.to_numpy()), Rotation.from_quat(start.to_numpy()), np.asarray([0, 0, 1])
-            )
-        ),
-        index=start.index,
-    )
-    return angles
+    strides = _split_by_stride(orientations)
+    start, end = _first_and_last_valid(strides.samples, strides.offsets)
+    return pd.Series(np.rad2deg(_twist_angle_around_z(end, start)), index=strides.stride_ids)
+
+
+def _twist_angle_around_z(ori: np.ndarray, ref: np.ndarray) -> np.ndarray:
+    """Get the rotation angle around the z-axis that transforms the orientations `ref` into `ori`.
+
+    This is the closed form of
+    `find_angle_between_orientations(Rotation.from_quat(ori), Rotation.from_quat(ref), [0, 0, 1])`
+    for quaternions (x, y, z, w).
+    We only need the z and the w component of the relative quaternion `ori * ref^-1`, as the twist around the z-axis
+    is fully defined by them.
+    As the result only depends on their ratio, the quaternions do not need to be normalized.
+    """
+    o_x, o_y, o_z, o_w = ori.T
+    r_x, r_y, r_z, r_w = ref.T
+    rel_z = o_z * r_w - o_w * r_z + o_y * r_x - o_x * r_y
+    rel_w = o_w * r_w + o_x * r_x + o_y * r_y + o_z * r_z
+    # We use the quaternion with positive w component to get an angle between -pi and pi.
+    sign = np.where(rel_w < 0, -1, 1)
+    return 2 * np.arctan2(sign * rel_z, sign * rel_w)
 
 
-def _calc_arc_length(positions: pd.DataFrame) -> pd.Series:
-    diff_per_sample = positions.groupby(level="s_id").diff().dropna()
-    norm_per_sample = pd.Series(norm(diff_per_sample, axis=1), index=diff_per_sample.index)
-    return norm_per_sample.groupby(level="s_id").sum()
+def _calc_arc_length(positions: Union[SingleSensorPositionList, _StrideSplit]) -> pd.Series:
+    strides = _as_stride_split(positions)
+    arc_length, n_valid_diffs = arc_length_per_stride(strides.samples, strides.offsets)
+    # Strides without a single valid sample difference do not get an arc length.
+    has_diffs = n_valid_diffs > 0
+    return pd.Series(arc_length[has_diffs], index=strides.stride_ids[has_diffs], dtype=float)
 
 
 def _compute_sole_angle_course(orientations: pd.DataFrame) -> pd.Series:
@@ -443,22 +513,36 @@ def _compute_sole_angle_course(orientations: pd.DataFrame) -> pd.Series:
         floor_angle.index = pd.MultiIndex(levels=[[], []], codes=[[], []], names=["s_id", "sample"])
         return floor_angle
 
-    forward = pd.DataFrame(
-        Rotation.from_quat(orientations.to_numpy()).apply([1, 0, 0]), columns=list("xyz"), index=orientations.index
-    )
-    floor_angle = np.rad2deg(find_unsigned_3d_angle(forward.to_numpy(), np.array([0, 0, 1]))) - 90
-    floor_angle = pd.Series(floor_angle, index=forward.index)
+    forward = _rotate_x_axis(orientations.to_numpy(dtype=float))
+    # The forward vector is a unit vector, hence, its angle with the z-axis minus 90 deg is simply the negative arcsin
+    # of its z-component.
+    floor_angle = -np.rad2deg(np.arcsin(np.clip(forward[:, 2], -1, 1)))
+    floor_angle = pd.Series(floor_angle, index=orientations.index)
     # Note: We discovered in #187 that due to a series of bugs the sign of these angles is flipped.
     # To follow the convention that the tc_angle should be smaller than 0 (during healthy walking), we multiply here.
     floor_angle *= -1
     return floor_angle
 
 
-def _calc_max_sensor_lift(positions: SingleSensorPositionList) -> pd.Series:
-    return positions["pos_z"].groupby(level="s_id").max()
+def _rotate_x_axis(quaternions: np.ndarray) -> np.ndarray:
+    """Rotate the local x-axis ([1, 0, 0]) by each of the provided quaternions (x, y, z, w).
+
+    This is the first column of the rotation matrix of each quaternion, which we calculate explicitly for all
+    quaternions at once instead of constructing a full rotation object.
+    """
+    q_x, q_y, q_z, q_w = normalize(quaternions).T
+    return np.column_stack((1 - 2 * (q_y**2 + q_z**2), 2 * (q_x * q_y + q_z * q_w), 2 * (q_x * q_z - q_y * q_w)))
+
+
+def _calc_max_sensor_lift(positions: Union[SingleSensorPositionList, _StrideSplit]) -> pd.Series:
+    strides = _as_stride_split(positions)
+    if len(strides.samples) == 0:
+        return pd.Series(index=strides.stride_ids, dtype=float)
+    pos_z = strides.samples[:, strides.columns.get_loc("pos_z")]
+    return pd.Series(np.fmax.reduceat(pos_z, strides.offsets[:-1]), index=strides.stride_ids)
 
 
-def _calc_max_lateral_excursion(positions: SingleSensorPositionList) -> pd.Series:
+def _calc_max_lateral_excursion(positions: Union[SingleSensorPositionList, _StrideSplit]) -> pd.Series:
     """Calculate the maximal lateral deviation from a straight line going from start pos to end pos of a stride.
 
     x1 = (x1,y1), x2 = (x2,y2) define the line
@@ -467,21 +551,9 @@ def _calc_max_lateral_excursion(positions: SingleSensorPositionList) -> pd.Serie
       =  abs((x2-x1)(y1-y0) - (x1-x0)(y2-y1))/stride_length
 
     """
-    if positions.empty:
+    strides = _as_stride_split(positions)
+    if len(strides.samples) == 0:
         return pd.Series()
-    start = positions.groupby(level="s_id").first()
-    end = positions.groupby(level="s_id").last()
-    stride_length = _calc_stride_length(positions)
-
-    def _calc_per_stride(start, end, length, data):
-        excursion = (
-            (end["pos_x"] - start["pos_x"]) * (start["pos_y"] - data["pos_y"])
-            - (start["pos_x"] - data["pos_x"]) * (end["pos_y"] - start["pos_y"])
-        ).abs()
-        max_excursion = excursion.max()
-        return max_excursion / length
-
-    max_lat_excursion = positions.groupby(level="s_id").apply(
-        lambda x: _calc_per_stride(start.loc[x.name], end.loc[x.name], stride_length.loc[x.name], x)
-    )
-    return max_lat_excursion
+    pos_x = np.ascontiguousarray(strides.samples[:, strides.columns.get_loc("pos_x")])
+    pos_y = np.ascontiguousarray(strides.samples[:, strides.columns.get_loc("pos_y")])
+    return pd.Series(max_lateral_excursion_per_stride(pos_x, pos_y, strides.offsets), index=strides.stride_ids)
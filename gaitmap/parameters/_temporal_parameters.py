@@ -163,14 +163,16 @@ class TemporalParameterCalculation(BaseTemporalParameterCalculation):
         """
         stride_event_list = set_correct_index(stride_event_list, SL_INDEX)
 
+        # All columns share the same index, so we calculate on the underlying arrays to skip the index alignment.
+        # Using `.array` instead of `.to_numpy()` keeps nullable dtypes (like `Int64`) intact.
         stride_time_start_col, stride_time_end_col = _get_stride_time_cols(self.expected_stride_type)
         stride_time = (
-            stride_event_list[stride_time_end_col] - stride_event_list[stride_time_start_col]
+            stride_event_list[stride_time_end_col].array - stride_event_list[stride_time_start_col].array
         ) / sampling_rate_hz
 
         swing_time_start_col, swing_time_end_col = _get_swing_time_cols(self.expected_stride_type)
         swing_time = (
-            stride_event_list[swing_time_end_col] - stride_event_list[swing_time_start_col]
+            stride_event_list[swing_time_end_col].array - stride_event_list[swing_time_start_col].array
         ) / sampling_rate_hz
         stance_time = stride_time - swing_time
         stride_parameter_dict = {
@@ -1,6 +1,7 @@
 """Wrapper to apply position and orientation estimation to multiple regions in a dataset."""
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from scipy.spatial.transform import Rotation
 from tpcp import CloneFactory, is_action_applied
@@ -13,7 +14,7 @@ from gaitmap.base import (
     BaseTrajectoryReconstructionWrapper,
 )
 from gaitmap.trajectory_reconstruction._trajectory_wrapper import (
-    _initial_orientation_from_start,
+    _initial_orientations_from_starts,
     _TrajectoryReconstructionWrapperMixin,
 )
 from gaitmap.trajectory_reconstruction.orientation_methods import SimpleGyroIntegration
@@ -112,6 +113,12 @@ class RegionLevelTrajectory(_TrajectoryReconstructionWrapperMixin, BaseTrajector
         region, start of the stride might coincide with the start of the signal. In that case the start of the window
         would result in a negative index, thus the window to get the initial orientation will be reduced (from 0 to
         `start+np.floor(align_window_size/2)`)
+    n_jobs
+        The number of processes used to estimate the trajectories of the individual sensors of a multi-sensor dataset
+        in parallel.
+        As all sensors are processed independently, this can speed up the estimation for datasets with multiple
+        sensors.
+        By default, all sensors are processed sequentially.
 
     Other Parameters
     ----------------
@@ -184,6 +191,7 @@ class RegionLevelTrajectory(_TrajectoryReconstructionWrapperMixin, BaseTrajector
     _action_methods = ("estimate", "estimate_intersect")
 
     align_window_width: int
+    n_jobs: int
 
     regions_of_interest: RegionsOfInterestList
     stride_event_list: StrideList
@@ -196,10 +204,13 @@ class RegionLevelTrajectory(_TrajectoryReconstructionWrapperMixin, BaseTrajector
         pos_method: Optional[BasePositionMethod] = CloneFactory(ForwardBackwardIntegration()),
         trajectory_method: Optional[BaseTrajectoryMethod] = None,
         align_window_width: int = 8,
+        n_jobs: int = 1,
     ):
         # TODO: Make align window with a second value?
         self.align_window_width = align_window_width
-        super().__init__(ori_method=ori_method, pos_method=pos_method, trajectory_method=trajectory_method)
+        super().__init__(
+            ori_method=ori_method, pos_method=pos_method, trajectory_method=trajectory_method, n_jobs=n_jobs
+        )
 
     def estimate(
         self,
@@ -425,14 +436,13 @@ class RegionLevelTrajectory(_TrajectoryReconstructionWrapperMixin, BaseTrajector
 
         stride_lists = intersect_stride_list(stride_event_list, regions_of_interest)
         output = {}
-        for (region_id, _), stride_list in zip(regions_of_interest.iterrows(), stride_lists):
-            for s_id, stride in stride_list.iterrows():
+        for region_id, stride_list in zip(regions_of_interest.index, stride_lists):
+            region_data = data.loc[region_id]
+            for s_id, start, end in stride_list[["start", "end"]].itertuples(index=True, name=None):
                 # This cuts out the n+1 samples for each stride.
                 # The first sample is the value before the stride started.
                 # This is the equivalent to the "initial" position/orientation
-                output[s_id] = (
-                    data.loc[region_id].iloc[int(stride["start"]) : int(stride["end"] + 1)].reset_index(drop=True)
-                )
+                output[s_id] = region_data.iloc[int(start) : int(end + 1)].reset_index(drop=True)
         output = pd.concat(output, names=["s_id", "sample"])
         return output
 
@@ -448,6 +458,6 @@ class RegionLevelTrajectory(_TrajectoryReconstructionWrapperMixin, BaseTrajector
         ]
         return super()._estimate_single_sensor(data, integration_regions, stride_list_list)
 
-    def _calculate_initial_orientation(self, data: SingleSensorData, start: int) -> Rotation:
+    def _calculate_initial_orientations(self, data: SingleSensorData, starts: np.ndarray) -> Rotation:
         # TODO: Does this way of getting the initial orientation makes sense for longer sequences?
-        return _initial_orientation_from_start(data, start, align_window_width=self.align_window_width)
+        return _initial_orientations_from_starts(data, starts, align_window_width=self.align_window_width)
@@ -1,6 +1,7 @@
 """Wrapper to apply position and orientation estimation to each stride of a dataset."""
-from typing import Optional
+from typing import List, Optional
 
+import numpy as np
 from scipy.spatial.transform import Rotation
 from tpcp import CloneFactory
 from typing_extensions import Self
@@ -12,7 +13,7 @@ from gaitmap.base import (
     BaseTrajectoryReconstructionWrapper,
 )
 from gaitmap.trajectory_reconstruction._trajectory_wrapper import (
-    _initial_orientation_from_start,
+    _initial_orientations_from_starts,
     _TrajectoryReconstructionWrapperMixin,
 )
 from gaitmap.trajectory_reconstruction.orientation_methods import SimpleGyroIntegration
@@ -21,6 +22,7 @@ from gaitmap.utils.consts import SL_INDEX
 from gaitmap.utils.datatype_helper import (
     SensorData,
     SingleSensorData,
+    SingleSensorStrideList,
     StrideList,
     is_sensor_data,
     is_stride_list,
@@ -86,6 +88,12 @@ class StrideLevelTrajectory(_TrajectoryReconstructionWrapperMixin, BaseTrajector
         stride, start of the stride might coincide with the start of the signal. In that case the start of the window
         would result in a negative index, thus the window to get the initial orientation will be reduced (from 0 to
         `start+np.floor(align_window_size/2)`)
+    n_jobs
+        The number of processes used to estimate the trajectories of the individual sensors of a multi-sensor dataset
+        in parallel.
+        As all sensors are processed independently, this can speed up the estimation for datasets with multiple
+        sensors.
+        By default, all sensors are processed sequentially.
 
     Other Parameters
     ----------------
@@ -129,6 +137,7 @@ class StrideLevelTrajectory(_TrajectoryReconstructionWrapperMixin, BaseTrajector
     """
 
     align_window_width: int
+    n_jobs: int
 
     stride_event_list: StrideList
 
@@ -141,10 +150,13 @@ class StrideLevelTrajectory(_TrajectoryReconstructionWrapperMixin, BaseTrajector
         pos_method: Optional[BasePositionMethod] = CloneFactory(ForwardBackwardIntegration()),
         trajectory_method: Optional[BaseTrajectoryMethod] = None,
         align_window_width: int = 8,
+        n_jobs: int = 1,
     ):
         # TODO: Make align window with a second value?
         self.align_window_width = align_window_width
-        super().__init__(ori_method=ori_method, pos_method=pos_method, trajectory_method=trajectory_method)
+        super().__init__(
+            ori_method=ori_method, pos_method=pos_method, trajectory_method=trajectory_method, n_jobs=n_jobs
+        )
 
     def estimate(self, data: SensorData, stride_event_list: StrideList, *, sampling_rate_hz: float) -> Self:
         """Use the initial rotation and the gyroscope signal to estimate the orientation to every time point .
@@ -180,16 +192,12 @@ class StrideLevelTrajectory(_TrajectoryReconstructionWrapperMixin, BaseTrajector
         # in each integration region.
         if stride_list_type == "single":
             stride_event_list = set_correct_index(stride_event_list, SL_INDEX)
-            stride_list_list = [
-                stride_event_list.iloc[[i]] - stride_event_list.iloc[i]["start"] for i in range(len(stride_event_list))
-            ]
+            stride_list_list = _split_into_normalized_strides(stride_event_list)
         else:
             stride_list_list = {}
             for sensor, stride_list in stride_event_list.items():
                 stride_list = set_correct_index(stride_list, SL_INDEX)
-                stride_list_list[sensor] = [
-                    stride_list.iloc[[i]] - stride_list.iloc[i]["start"] for i in range(len(stride_list))
-                ]
+                stride_list_list[sensor] = _split_into_normalized_strides(stride_list)
 
         self._estimate(
             data=data,
@@ -199,5 +207,12 @@ class StrideLevelTrajectory(_TrajectoryReconstructionWrapperMixin, BaseTrajector
         )
         return self
 
-    def _calculate_initial_orientation(self, data: SingleSensorData, start: int) -> Rotation:
-        return _initial_orientation_from_start(data, start, align_window_width=self.align_window_width)
+    def _calculate_initial_orientations(self, data: SingleSensorData, starts: np.ndarray) -> Rotation:
+        return _initial_orientations_from_starts(data, starts, align_window_width=self.align_window_width)
+
+
+def _split_into_normalized_strides(stride_list: SingleSensorStrideList) -> List[SingleSensorStrideList]:
+    """Split a stride list into one single-row stride list per stride, with all events relative to the stride start."""
+    # We normalize all strides at once and only split them afterwards.
+    normalized = stride_list.sub(stride_list["start"], axis=0)
+    return [normalized.iloc[[i]] for i in range(len(normalized))]
@@ -4,6 +4,7 @@ from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from scipy.spatial.transform import Rotation
 from tpcp import cf
 from typing_extensions import Literal, Self
@@ -25,11 +26,14 @@ from gaitmap.utils.datatype_helper import (
 )
 from gaitmap.utils.rotations import get_gravity_rotation, rotate_dataset_series
 
+_Methods = Tuple[Optional[BaseOrientationMethod], Optional[BasePositionMethod], Optional[BaseTrajectoryMethod]]
+
 
 class _TrajectoryReconstructionWrapperMixin:
     ori_method: Optional[BaseOrientationMethod]
     pos_method: Optional[BasePositionMethod]
     trajectory_method: Optional[BaseTrajectoryMethod]
+    n_jobs: int
 
     data: SensorData
     sampling_rate_hz: float
@@ -44,10 +48,12 @@ class _TrajectoryReconstructionWrapperMixin:
         ori_method: Optional[BaseOrientationMethod] = cf(SimpleGyroIntegration()),
         pos_method: Optional[BasePositionMethod] = cf(ForwardBackwardIntegration()),
         trajectory_method: Optional[BaseTrajectoryMethod] = None,
+        n_jobs: int = 1,
     ):
         self.ori_method = ori_method
         self.pos_method = pos_method
         self.trajectory_method = trajectory_method
+        self.n_jobs = n_jobs
 
     def _validate_methods(self):
         if self.trajectory_method:
@@ -97,11 +103,15 @@ class _TrajectoryReconstructionWrapperMixin:
         if dataset_type == "single":
             results = self._estimate_single_sensor(data, integration_regions, stride_list_list)
         else:
-            results_dict: Dict[_Hashable, Dict[str, pd.DataFrame]] = {}
-            for sensor in get_multi_sensor_names(data):
-                results_dict[sensor] = self._estimate_single_sensor(
+            sensors = get_multi_sensor_names(data)
+            # The sensors are independent of each other, so they can be processed in parallel.
+            results_list = Parallel(n_jobs=self.n_jobs)(
+                delayed(self._estimate_single_sensor)(
                     data[sensor], integration_regions[sensor], stride_list_list[sensor] if stride_list_list else None
                 )
+                for sensor in sensors
+            )
+            results_dict: Dict[_Hashable, Dict[str, pd.DataFrame]] = dict(zip(sensors, results_list))
             results = invert_result_dictionary(results_dict)
         set_params_from_dict(self, results, result_formatting=True)
         return self
@@ -114,9 +124,9 @@ class _TrajectoryReconstructionWrapperMixin:
     ) -> Dict[str, pd.DataFrame]:
         integration_regions = set_correct_index(integration_regions, self._expected_integration_region_index)
         full_index = (*self._expected_integration_region_index, "sample")
-        orientation = {}
-        velocity = {}
-        position = {}
+        orientation = []
+        velocity = []
+        position = []
         if stride_list_list is not None:
             if len(stride_list_list) != len(integration_regions):
                 raise ValueError(
@@ -127,53 +137,70 @@ class _TrajectoryReconstructionWrapperMixin:
             stride_list_list = [None] * len(integration_regions)
 
         if len(integration_regions) == 0:
-            index = pd.MultiIndex(levels=[[], []], codes=[[], []], names=full_index)
+            # The levels get the same (integer) dtype as for non-empty results.
+            # Each output gets its own copy of the index, as index names can be changed inplace.
+            index = pd.MultiIndex.from_arrays([np.empty(0, dtype="int64")] * 2, names=full_index)
             return {
                 "orientation": pd.DataFrame(columns=GF_ORI, index=index.copy()),
                 "velocity": pd.DataFrame(columns=GF_VEL, index=index.copy()),
                 "position": pd.DataFrame(columns=GF_POS, index=index.copy()),
             }
-        for (r_id, i_region), stride_list in zip(integration_regions.iterrows(), stride_list_list):
-            i_start, i_end = (int(i_region["start"]), int(i_region["end"]))
-            i_orientation, i_velocity, i_position = self._estimate_region(data, i_start, i_end, stride_list)
-            orientation[r_id] = pd.DataFrame(i_orientation.as_quat(), columns=GF_ORI)
-            velocity[r_id] = pd.DataFrame(i_velocity, columns=GF_VEL)
-            position[r_id] = pd.DataFrame(i_position, columns=GF_POS)
-        orientation_df = pd.concat(orientation)
-        orientation_df.index = orientation_df.index.rename(full_index)
-        velocity_df = pd.concat(velocity)
-        velocity_df.index = velocity_df.index.rename(full_index)
-        position_df = pd.concat(position)
-        position_df.index = position_df.index.rename(full_index)
-        return {"orientation": orientation_df, "velocity": velocity_df, "position": position_df}
+        # We extract all region borders at once, instead of creating a new Series for each region.
+        region_borders = integration_regions[["start", "end"]].to_numpy().astype("int64")
+        # The initial orientations of all regions are calculated in one go.
+        initial_orientations = self._calculate_initial_orientations(data, region_borders[:, 0])
+        # The methods are only cloned once and then reused for all regions.
+        # This is possible, as only the initial orientation changes between regions and all results are overwritten by
+        # each call to `estimate`.
+        methods = self._clone_methods()
+        for i, ((i_start, i_end), stride_list) in enumerate(zip(region_borders, stride_list_list)):
+            i_orientation, i_velocity, i_position = self._estimate_region(
+                data, (int(i_start), int(i_end), initial_orientations[i]), stride_list, methods
+            )
+            orientation.append(i_orientation.as_quat())
+            velocity.append(_region_result_as_array(i_velocity, GF_VEL))
+            position.append(_region_result_as_array(i_position, GF_POS))
+        # The results of all regions are only combined into dataframes once at the end.
+        region_ids = integration_regions.index
+        return {
+            "orientation": _combine_region_results(region_ids, orientation, GF_ORI, full_index),
+            "velocity": _combine_region_results(region_ids, velocity, GF_VEL, full_index),
+            "position": _combine_region_results(region_ids, position, GF_POS, full_index),
+        }
 
     def _estimate_region(
-        self, data: SingleSensorData, start: int, end: int, stride_event_list: SingleSensorStrideList
+        self,
+        data: SingleSensorData,
+        region: Tuple[int, int, Rotation],
+        stride_event_list: SingleSensorStrideList,
+        methods: _Methods,
     ) -> Tuple[Rotation, pd.DataFrame, pd.DataFrame]:
-        stride_data = data.iloc[start:end].copy()
-        initial_orientation = self._calculate_initial_orientation(data, start)
+        start, end, initial_orientation = region
+        # No copy is required here, as none of the methods modify the data they get passed.
+        stride_data = data.iloc[start:end]
+        ori_method, pos_method, trajectory_method = methods
 
         if self._combined_algo_mode is False:
             # For the type-checker
-            assert self.ori_method is not None
-            assert self.pos_method is not None
+            assert ori_method is not None
+            assert pos_method is not None
             # Apply the orientation method
-            ori_method = self.ori_method.clone().set_params(initial_orientation=initial_orientation)
+            ori_method = ori_method.set_params(initial_orientation=initial_orientation)
             orientation = ori_method.estimate(
                 stride_data, sampling_rate_hz=self.sampling_rate_hz, stride_event_list=stride_event_list
             ).orientation_object_
 
             rotated_stride_data = rotate_dataset_series(stride_data, orientation[:-1])
             # Apply the Position method
-            pos_method = self.pos_method.clone().estimate(
+            pos_method = pos_method.estimate(
                 rotated_stride_data, sampling_rate_hz=self.sampling_rate_hz, stride_event_list=stride_event_list
             )
             velocity = pos_method.velocity_
             position = pos_method.position_
         else:
             # For the type-checker
-            assert self.trajectory_method is not None
-            trajectory_method = self.trajectory_method.clone().set_params(initial_orientation=initial_orientation)
+            assert trajectory_method is not None
+            trajectory_method = trajectory_method.set_params(initial_orientation=initial_orientation)
             trajectory_method = trajectory_method.estimate(
                 stride_data, sampling_rate_hz=self.sampling_rate_hz, stride_event_list=stride_event_list
             )
@@ -182,41 +209,85 @@ class _TrajectoryReconstructionWrapperMixin:
             position = trajectory_method.position_
         return orientation, velocity, position
 
-    def _calculate_initial_orientation(self, data: SingleSensorData, start: int) -> Rotation:
+    def _clone_methods(self) -> _Methods:
+        if self._combined_algo_mode is False:
+            # For the type-checker
+            assert self.ori_method is not None
+            assert self.pos_method is not None
+            return self.ori_method.clone(), self.pos_method.clone(), None
+        assert self.trajectory_method is not None
+        return None, None, self.trajectory_method.clone()
+
+    def _calculate_initial_orientations(self, data: SingleSensorData, starts: np.ndarray) -> Rotation:
         raise NotImplementedError()
 
 
-def _initial_orientation_from_start(data: SingleSensorData, start: int, align_window_width: int) -> Rotation:
-    """Calculate the initial orientation for a section of data using a gravity alignment on the first n samples.
+def _region_result_as_array(result: Union[pd.DataFrame, np.ndarray], columns: List[str]) -> np.ndarray:
+    """Get the values of a per-region result of an ori or pos method.
+
+    Like in the `pd.DataFrame` constructor, the columns of a dataframe result are selected by their names.
+    """
+    if isinstance(result, pd.DataFrame):
+        if list(result.columns) != columns:
+            result = result.reindex(columns=columns)
+        return result.to_numpy()
+    return np.asarray(result)
+
+
+def _combine_region_results(
+    region_ids: pd.Index, results: List[np.ndarray], columns: List[str], index_names: Sequence[str]
+) -> pd.DataFrame:
+    """Combine the results of all regions into one dataframe indexed by the region id and the sample within the region.
+
+    This is equivalent to concatenating one dataframe per region, but copies all values only once.
+    """
+    lengths = np.array([len(r) for r in results], dtype="int64")
+    region_starts = np.cumsum(lengths) - lengths
+    samples = np.arange(lengths.sum()) - np.repeat(region_starts, lengths)
+    index = pd.MultiIndex.from_arrays([np.repeat(region_ids.to_numpy(), lengths), samples], names=index_names)
+    return pd.DataFrame(np.concatenate(results), index=index, columns=columns)
+
+
+def _initial_orientations_from_starts(data: SingleSensorData, starts: np.ndarray, align_window_width: int) -> Rotation:
+    """Calculate the initial orientations for sections of data using a gravity alignment on the first n samples.
 
     Parameters
     ----------
     data
         The full data of a recording
-    start
-        The start value in samples of the section of interest in data
+    starts
+        The start values in samples of the sections of interest in data
     align_window_width
-        The size of the window around start that is considered for the alignment.
+        The size of the window around each start that is considered for the alignment.
         The window is centered around start.
         If the value is 0 only the start sample is considered.
 
     Returns
     -------
-    initial_orientation
-        The initial orientation, which would align the start of the data section with gravity.
+    initial_orientations
+        One initial orientation per start, which would align the start of the data section with gravity.
 
     """
     half_window = int(np.floor(align_window_width / 2))
-    if start - half_window >= 0:
-        start_sample = start - half_window
-    else:
-        start_sample = 0
+    starts = np.asarray(starts, dtype="int64")
+    if np.any(starts - half_window < 0):
         warnings.warn("Could not use complete window length for initializing orientation.")
-    if start + half_window < len(data):
-        end_sample = start + half_window
-    else:
-        end_sample = len(data) - 1
+    if np.any(starts + half_window >= len(data)):
         warnings.warn("Could not use complete window length for initializing orientation.")
-    acc = (data[SF_ACC].iloc[start_sample : end_sample + 1]).median()
+    # All windows are extracted with one fancy-indexing operation.
+    # Samples outside the data are marked as NaN, so that shortened windows at the borders are handled like in pandas.
+    window_idx = starts[:, None] + np.arange(-half_window, half_window + 1)[None, :]
+    outside = (window_idx < 0) | (window_idx >= len(data))
+    # Only the acc columns are converted, as the data might contain additional (non-numeric) columns.
+    acc = data[SF_ACC].to_numpy(dtype=float)
+    windows = acc[np.clip(window_idx, 0, max(len(data) - 1, 0))]
+    windows[outside] = np.nan
+    if np.isnan(windows).any():
+        with warnings.catch_warnings():
+            # Windows that only contain NaNs result in NaN, like the pandas median
+            warnings.simplefilter("ignore", RuntimeWarning)
+            medians = np.nanmedian(windows, axis=1)
+    else:
+        medians = np.median(windows, axis=1)
     # get_gravity_rotation assumes [0, 0, 1] as gravity
-    return get_gravity_rotation(acc)
+    return get_gravity_rotation(medians)
@@ -9,6 +9,7 @@ from tpcp import cf
 from typing_extensions import Self
 
 from gaitmap.base import BaseOrientationMethod
+from gaitmap.utils._algo_helper import columns_as_array
 from gaitmap.utils.consts import SF_GYR
 from gaitmap.utils.datatype_helper import SingleSensorData, is_single_sensor_data
 from gaitmap.utils.fast_quaternion_math import rate_of_change_from_gyro
@@ -115,7 +116,7 @@ class SimpleGyroIntegration(BaseOrientationMethod):
         if isinstance(initial_orientation, Rotation):
             initial_orientation = Rotation.as_quat(initial_orientation)
         initial_orientation = initial_orientation.copy()
-        gyro_data = np.deg2rad(data[SF_GYR].to_numpy())
+        gyro_data = np.deg2rad(columns_as_array(data, SF_GYR))
         simple_gyro_integration_series = memory.cache(_simple_gyro_integration_series)
 
         rots = simple_gyro_integration_series(
@@ -9,6 +9,7 @@ from tpcp import cf
 from typing_extensions import Self
 
 from gaitmap.base import BasePositionMethod
+from gaitmap.utils._algo_helper import columns_as_array
 from gaitmap.utils.consts import GF_POS, GF_VEL, GRAV_VEC, SF_ACC
 from gaitmap.utils.datatype_helper import SingleSensorData, is_single_sensor_data
 
@@ -142,7 +143,7 @@ class ForwardBackwardIntegration(BasePositionMethod):
             raise ValueError("`turning_point` must be in the rage of 0.0 to 1.0")
         is_single_sensor_data(self.data, check_gyr=False, frame="sensor", raise_exception=True)
 
-        acc_data = data[SF_ACC].to_numpy()
+        acc_data = columns_as_array(data, SF_ACC)
         if self.gravity is not None:
             acc_data -= self.gravity
 
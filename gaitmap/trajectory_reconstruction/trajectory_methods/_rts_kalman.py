@@ -16,6 +16,7 @@ from gaitmap.trajectory_reconstruction.trajectory_methods._kalman_numba_funcs im
     rts_kalman_update_series,
     simple_navigation_equations,
 )
+from gaitmap.utils._algo_helper import columns_as_array
 from gaitmap.utils.consts import GF_POS, GF_VEL, SF_ACC, SF_GYR
 from gaitmap.utils.datatype_helper import SingleSensorData, SingleSensorStrideList, is_single_sensor_data
 from gaitmap.zupt_detection import NormZuptDetector
@@ -237,8 +238,8 @@ class RtsKalman(BaseTrajectoryMethod):
         zupts = zupt_detector.per_sample_zupts_
         self.zupts_ = zupt_detector.zupts_
 
-        gyro_data = np.deg2rad(data[SF_GYR].to_numpy())
-        acc_data = data[SF_ACC].to_numpy()
+        gyro_data = np.deg2rad(columns_as_array(data, SF_GYR))
+        acc_data = columns_as_array(data, SF_ACC)
 
         parameters = SimpleZuptParameter(level_walking=self.level_walking)
 
@@ -1,7 +1,10 @@
 """A set of helper functions to make developing algorithms easier."""
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
 
 from gaitmap.utils._types import _Hashable, _HashableVar
 
@@ -53,3 +56,21 @@ def set_params_from_dict(obj: Any, param_dict: dict[str, Any], result_formatting
         if result_formatting is True and not k.endswith("_"):
             k += "_"
         setattr(obj, k, v)
+
+
+def columns_as_array(data: pd.DataFrame, columns: Sequence[_Hashable]) -> np.ndarray:
+    """Get the values of multiple columns of a dataframe as a new 2D array with one column per entry in `columns`.
+
+    This is equivalent to `data[columns].to_numpy()`, but avoids creating the intermediate dataframe.
+    For the small dataframes (e.g. of individual strides) that are passed to the algorithms, this is multiple times
+    faster.
+
+    Examples
+    --------
+    >>> df = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0], "c": [5.0, 6.0]})
+    >>> columns_as_array(df, ["c", "a"])
+    array([[5., 1.],
+           [6., 2.]])
+
+    """
+    return np.column_stack([data[c].to_numpy() for c in columns])
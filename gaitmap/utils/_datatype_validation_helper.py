@@ -81,11 +81,14 @@ def _assert_has_columns(df: pd.DataFrame, columns_sets: Sequence[Union[List[_Has
     >>> # This raises no error, as df contains all columns of the second set
 
     """
-    columns_sets_as_set = [set(col_set) for col_set in columns_sets]
     columns = df.columns
-    result = False
-    for col_set in columns_sets_as_set:
-        result = result or all(v in columns for v in col_set)
+    if isinstance(columns, pd.MultiIndex):
+        # For a MultiIndex, `in` also matches partial keys (e.g. only the first level), which a set of tuples would not.
+        result = any(all(v in columns for v in col_set) for col_set in columns_sets)
+    else:
+        # For normal columns, we convert them to a set once, and then only check for subsets.
+        available_columns = set(columns)
+        result = any(available_columns.issuperset(col_set) for col_set in columns_sets)
 
     if result is False:
         if len(columns_sets) == 1:
@@ -57,6 +57,12 @@ VelocityList = Union[SingleSensorVelocityList, MultiSensorVelocityList]
 MultiSensorOrientationList = Dict[_Hashable, pd.DataFrame]
 OrientationList = Union[SingleSensorOrientationList, MultiSensorOrientationList]
 
+# All columns a stride list of a certain type must have, if the additional columns are checked as well (the default).
+_SL_REQUIRED_COLS = {
+    stride_type: [*SL_COLS, *SL_MINIMAL_COLS.get(stride_type, []), *SL_ADDITIONAL_COLS.get(stride_type, [])]
+    for stride_type in ("any", *SL_ADDITIONAL_COLS)
+}
+
 
 def to_dict_multi_sensor_data(sensordata: MultiSensorData) -> Dict[_Hashable, SingleSensorData]:
     """Convert a multi-sensor data to a dictionary of single sensor datas.
@@ -346,15 +352,12 @@ def is_single_sensor_stride_list(
 
         stride_list = set_correct_index(stride_list, SL_INDEX)
 
+        # Check if it has the correct columns
         if check_additional_cols is True:
-            additional_cols = SL_ADDITIONAL_COLS.get(stride_type, [])
-        elif check_additional_cols is False:
-            additional_cols = ()
+            all_columns = _SL_REQUIRED_COLS[stride_type]
         else:
-            additional_cols = check_additional_cols
-
-        # Check if it has the correct columns
-        all_columns = [*SL_COLS, *SL_MINIMAL_COLS.get(stride_type, []), *additional_cols]
+            additional_cols = () if check_additional_cols is False else check_additional_cols
+            all_columns = [*SL_COLS, *SL_MINIMAL_COLS.get(stride_type, []), *additional_cols]
         _assert_has_columns(stride_list, [all_columns])
 
         start_event = {"min_vel": "min_vel", "ic": "ic"}
@@ -368,8 +371,9 @@ def is_single_sensor_stride_list(
                 "For a {} stride list, the start column is expected to be identical to the {} column, "
                 "but they are different.".format(stride_type, start_event[stride_type])
             )
-        # Check that the stride ids are unique
-        if not stride_list.index.nunique() == stride_list.index.size:
+        # Check that the stride ids are unique.
+        # `is_unique` and `hasnans` are cached by pandas, which makes this much cheaper than counting the unique values.
+        if not stride_list.index.is_unique or stride_list.index.hasnans:
             raise ValidationError("The stride id of the stride list is expected to be unique.")
 
     except ValidationError as e:
@@ -584,7 +588,7 @@ def is_single_sensor_regions_of_interest_list(
         _assert_has_columns(roi_list, [["start", "end"]])
 
         # Check that the roi ids are unique
-        if not roi_list.index.nunique() == roi_list.index.size:
+        if not roi_list.index.is_unique or roi_list.index.hasnans:
             raise ValidationError("The roi/gs id of the stride list is expected to be unique.")
     except ValidationError as e:
         if raise_exception is True:
@@ -1245,7 +1249,12 @@ def set_correct_index(
     # In case not all columns are in the index, reset_the index and check the column names
     wrong_index = [i for i, n in enumerate(df.index.names) if n not in index_cols]
     all_wrong = len(wrong_index) == len(df.index.names)
-    df_just_right_index = df.reset_index(level=wrong_index, drop=drop_false_index_cols)
+    if all_wrong and drop_false_index_cols:
+        # The old index would be dropped completely, which `set_index` does anyway.
+        # Hence, we can skip the copy created by `reset_index`.
+        df_just_right_index = df
+    else:
+        df_just_right_index = df.reset_index(level=wrong_index, drop=drop_false_index_cols)
     if not all_wrong:
         # In case correct index cols are remaining make them to regular columns
         df_just_right_index = df_just_right_index.reset_index()
@@ -17,7 +17,7 @@ from gaitmap.utils.datatype_helper import (
     is_sensor_data,
     is_single_sensor_data,
 )
-from gaitmap.utils.vector_math import find_orthogonal, normalize, row_wise_dot
+from gaitmap.utils.vector_math import find_orthogonal, is_almost_parallel_or_antiparallel, normalize, row_wise_dot
 
 
 def rotation_from_angle(axis: np.ndarray, angle: Union[float, np.ndarray]) -> Rotation:
@@ -108,12 +108,27 @@ def _flip_sensor(data: SingleSensorData, rotation: Optional[Rotation]) -> Single
 
 def _rotate_sensor(data: SingleSensorData, rotation: Optional[Rotation]) -> SingleSensorData:
     """Rotate the data of a single sensor with acc and gyro."""
-    data = data.copy()
     if rotation is None:
+        return data.copy()
+    gyr_idx = data.columns.get_indexer(SF_GYR)
+    acc_idx = data.columns.get_indexer(SF_ACC)
+    values = data.to_numpy(copy=True)
+    # Gyro and acc are rotated together with one batched matrix product instead of two `Rotation.apply` calls.
+    # This works for a single rotation as well as for one rotation per sample.
+    vectors = values[:, np.concatenate([gyr_idx, acc_idx])].astype(float).reshape(len(data), 2, 3)
+    matrices = rotation.as_matrix()
+    if not rotation.single:
+        matrices = matrices[:, None]
+    rotated = np.matmul(matrices, vectors[..., None])[..., 0]
+    if values.dtype != np.float64:
+        # Other or mixed column dtypes can not be represented by a single float array without changing them.
+        data = data.copy()
+        data[SF_GYR] = rotated[:, 0]
+        data[SF_ACC] = rotated[:, 1]
         return data
-    data[SF_GYR] = rotation.apply(data[SF_GYR].to_numpy())
-    data[SF_ACC] = rotation.apply(data[SF_ACC].to_numpy())
-    return data
+    values[:, gyr_idx] = rotated[:, 0]
+    values[:, acc_idx] = rotated[:, 1]
+    return pd.DataFrame(values, index=data.index, columns=data.columns)
 
 
 def _rotate_or_flip_dataset(
@@ -294,15 +309,16 @@ def get_gravity_rotation(gravity_vector: np.ndarray, expected_gravity: np.ndarra
 
     Parameters
     ----------
-    gravity_vector : vector with shape (3,)
-        axis ([x, y ,z])
+    gravity_vector : vector with shape (3,) or array of vectors with shape (n, 3)
+        axis ([x, y ,z]) or array of axis
     expected_gravity : vector with shape (3,)
         axis ([x, y ,z])
 
     Returns
     -------
     rotation
-        rotation between given gravity vector and the expected gravity
+        rotation between given gravity vector and the expected gravity.
+        If multiple gravity vectors are provided, this contains one rotation per vector.
 
     Examples
     --------
@@ -313,10 +329,28 @@ def get_gravity_rotation(gravity_vector: np.ndarray, expected_gravity: np.ndarra
     >>> rotated
     array([0., 0., 1.])
 
+    Multiple gravity vectors
+
+    >>> rot = get_gravity_rotation(np.array([[1, 0, 0], [0, 0, 2]]))
+    >>> rot.apply(np.array([[1, 0, 0], [0, 0, 1]])).round(decimals=3)
+    array([[0., 0., 1.],
+           [0., 0., 1.]])
+
     """
-    gravity_vector = normalize(gravity_vector)
+    gravity_vector = normalize(np.asarray(gravity_vector, dtype=float))
     expected_gravity = normalize(expected_gravity)
-    return find_shortest_rotation(gravity_vector, expected_gravity)
+    if gravity_vector.ndim == 1:
+        return find_shortest_rotation(gravity_vector, expected_gravity)
+    # For multiple vectors, we use the closed form of the shortest rotation quaternion (cross(v1, v2), 1 + dot(v1, v2))
+    # for all vectors at once.
+    # This is undefined, if the vectors are antiparallel. These (rare) cases are handled individually.
+    quats = np.empty((len(gravity_vector), 4))
+    quats[:, :3] = np.cross(gravity_vector, expected_gravity)
+    quats[:, 3] = 1 + row_wise_dot(gravity_vector, expected_gravity)
+    antiparallel = is_almost_parallel_or_antiparallel(gravity_vector, expected_gravity) & (quats[:, 3] < 1)
+    for i in np.flatnonzero(antiparallel):
+        quats[i] = find_shortest_rotation(gravity_vector[i], expected_gravity).as_quat()
+    return Rotation.from_quat(quats)
 
 
 def find_rotation_around_axis(rot: Rotation, rotation_axis: Union[np.ndarray, List]) -> Rotation:
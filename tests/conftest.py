@@ -1,5 +1,6 @@
 import random
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Union
 
 import numpy as np
 import pandas as pd
@@ -18,6 +19,7 @@ from gaitmap.example_data import (
     get_healthy_example_stride_events,
     get_ms_example_imu_data,
 )
+from gaitmap.utils.coordinate_conversion import convert_to_fbf
 from tests._regression_utils import PyTestSnapshotTest
 
 try:
@@ -46,13 +48,38 @@ def pytest_addoption(parser):
     )
 
 
-healthy_example_imu_data = pytest.fixture()(get_healthy_example_imu_data)
-ms_example_imu_data = pytest.fixture()(get_ms_example_imu_data)
-healthy_example_stride_borders = pytest.fixture()(get_healthy_example_stride_borders)
-healthy_example_mocap_data = pytest.fixture()(get_healthy_example_mocap_data)
-healthy_example_stride_events = pytest.fixture()(get_healthy_example_stride_events)
-healthy_example_orientation = pytest.fixture()(get_healthy_example_orientation)
-healthy_example_position = pytest.fixture()(get_healthy_example_position)
+def _example_data_fixture(loader: Callable[[], Union[pd.DataFrame, Dict[str, pd.DataFrame]]]):
+    """Create a fixture that parses the example data only once per session.
+
+    Every test still gets its own copy, so that tests that modify the data can not influence each other.
+    """
+    cached_loader = lru_cache(maxsize=None)(loader)
+
+    @pytest.fixture()
+    def example_data_fixture():
+        data = cached_loader()
+        if isinstance(data, dict):
+            return {k: v.copy() for k, v in data.items()}
+        return data.copy()
+
+    return example_data_fixture
+
+
+healthy_example_imu_data = _example_data_fixture(get_healthy_example_imu_data)
+ms_example_imu_data = _example_data_fixture(get_ms_example_imu_data)
+healthy_example_stride_borders = _example_data_fixture(get_healthy_example_stride_borders)
+healthy_example_mocap_data = _example_data_fixture(get_healthy_example_mocap_data)
+healthy_example_stride_events = _example_data_fixture(get_healthy_example_stride_events)
+healthy_example_orientation = _example_data_fixture(get_healthy_example_orientation)
+healthy_example_position = _example_data_fixture(get_healthy_example_position)
+
+
+def _get_healthy_example_imu_data_fbf():
+    """Get the healthy example data converted into the foot body frame."""
+    return convert_to_fbf(get_healthy_example_imu_data(), left=["left_sensor"], right=["right_sensor"])
+
+
+healthy_example_imu_data_fbf = _example_data_fixture(_get_healthy_example_imu_data_fbf)
 
 
 def _get_params_without_nested_class(instance: BaseTpcpObject) -> Dict[str, Any]:
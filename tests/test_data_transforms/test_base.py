@@ -93,6 +93,14 @@ class TestGroupedTransformer:
         assert id(t.data) == id(data)
         assert_frame_equal(t.transformed_data_, data / 3.0)
 
+    def test_parallel_transform(self):
+        data = pd.DataFrame(np.random.rand(10, 4), columns=list("abcd"))
+        mapping = [("a", FixedScaler(2)), (("b", "c"), FixedScaler(3, 1))]
+        sequential = GroupedTransformer(transformer_mapping=mapping).transform(data)
+        parallel = GroupedTransformer(transformer_mapping=mapping, n_jobs=2).transform(data)
+
+        assert_frame_equal(parallel.transformed_data_, sequential.transformed_data_)
+
     def test_error_when_transformer_not_unique(self):
         scaler = FixedScaler(3)
         t = GroupedTransformer(transformer_mapping=[("b", scaler), ("a", scaler)])
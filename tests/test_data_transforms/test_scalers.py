@@ -46,6 +46,24 @@ class TestMetaFunctionality(TestAlgorithmMixin):
         return after_instance
 
 
+class TestDtypeHandling:
+    @pytest.mark.parametrize(
+        "scaler", [FixedScaler(2, 1), AbsMaxScaler(), MinMaxScaler(), TrainableAbsMaxScaler(data_max=2.0)]
+    )
+    def test_float32_is_preserved(self, scaler):
+        data = pd.DataFrame(np.random.rand(10, 3).astype(np.float32))
+        transformed = scaler.transform(data).transformed_data_
+        assert (transformed.dtypes == np.float32).all()
+
+    @pytest.mark.parametrize(
+        "scaler", [FixedScaler(2, 1), AbsMaxScaler(), MinMaxScaler(), TrainableAbsMaxScaler(data_max=2.0)]
+    )
+    def test_mixed_dtypes_are_preserved(self, scaler):
+        data = pd.DataFrame({"a": np.random.rand(10).astype(np.float32), "b": np.random.rand(10)})
+        transformed = scaler.transform(data).transformed_data_
+        assert_frame_equal(transformed.dtypes.to_frame(), data.dtypes.to_frame())
+
+
 class TestFixedScaler:
     def test_transform_default(self):
         t = FixedScaler()
@@ -63,6 +81,12 @@ class TestFixedScaler:
         assert id(t.data) == id(data)
         assert t.transformed_data_.equals((data - offset) / scale)
 
+    def test_per_column_offset_is_aligned_by_name(self):
+        t = FixedScaler(scale=pd.Series({"b": 2, "a": 1}), offset=pd.Series({"b": 1, "a": 2}))
+        data = pd.DataFrame({"a": [1.0, 3.0], "b": [1.0, 5.0]})
+        t.transform(data)
+        assert_frame_equal(t.transformed_data_, pd.DataFrame({"a": [-1.0, 1.0], "b": [0.0, 2.0]}))
+
 
 class TestStandardScaler:
     @pytest.mark.parametrize("ddof", [0, 1, 2])
@@ -126,6 +150,13 @@ class TestAbsMaxScaler:
         assert t.transformed_data_.abs().to_numpy().max() == pytest.approx(out_max, rel=1e-3)
         assert_frame_equal(t.transformed_data_, data / np.max(np.abs(data.to_numpy())) * out_max)
 
+    def test_nan_values_are_ignored(self):
+        t = AbsMaxScaler(out_max=1)
+        data = pd.DataFrame([[0, np.nan, 1], [-4, 1, np.nan]])
+        assert t._get_abs_max(data) == 4
+        t.transform(data)
+        assert_frame_equal(t.transformed_data_, data / 4)
+
 
 class TestTrainableAbsMaxScaler:
     @pytest.mark.parametrize("out_max", [2, 3, 0.3])
@@ -171,6 +202,11 @@ class TestMinMaxScaler:
         with pytest.raises(ValueError):
             t.transform(data)
 
+    def test_nan_values_are_ignored(self):
+        t = MinMaxScaler()
+        data = pd.DataFrame([[0, np.nan, 1], [-4, 2, np.nan]])
+        assert t._calc_data_range(data) == (-4, 2)
+
 
 class TestTrainableMinMaxScaler:
     @pytest.mark.parametrize("out_range", [(0, 1), (0, 2), (-1, 1), (-1, 2)])
@@ -4,7 +4,6 @@ from pandas._testing import assert_frame_equal
 from gaitmap.base import BaseType
 from gaitmap.data_transform import ButterworthFilter
 from gaitmap.event_detection import FilteredRamppEventDetection, RamppEventDetection
-from gaitmap.utils import coordinate_conversion
 from gaitmap.utils.consts import BF_COLS
 from tests.mixins.test_algorithm_mixin import TestAlgorithmMixin
 from tests.mixins.test_caching_mixin import TestCachingMixin
@@ -36,11 +35,9 @@ class TestCachingFunctionality(MetaTestConfig, TestCachingMixin):
 class TestEventDetectionRamppFiltered(TestEventDetectionRampp):
     algorithm_class = FilteredRamppEventDetection
 
-    def test_is_identical_to_normal_rampp(self, healthy_example_imu_data, healthy_example_stride_borders, snapshot):
+    def test_is_identical_to_normal_rampp(self, healthy_example_imu_data_fbf, healthy_example_stride_borders, snapshot):
         """Test if the output is the same as normal Rampp for lax filter parameters."""
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+        data = healthy_example_imu_data_fbf
 
         ed = self.algorithm_class()
         ed.detect(data, healthy_example_stride_borders, sampling_rate_hz=204.8)
@@ -51,10 +48,10 @@ class TestEventDetectionRamppFiltered(TestEventDetectionRampp):
             assert_frame_equal(ed.segmented_event_list_[sensor], rampp_ed.segmented_event_list_[sensor])
 
     @pytest.mark.parametrize("filter_paras", [(3, 5), (2, 10)])
-    def test_correct_arguments_are_passed(self, healthy_example_imu_data, healthy_example_stride_borders, filter_paras):
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+    def test_correct_arguments_are_passed(
+        self, healthy_example_imu_data_fbf, healthy_example_stride_borders, filter_paras
+    ):
+        data = healthy_example_imu_data_fbf
         filter = ButterworthFilter(*filter_paras)
 
         ed = self.algorithm_class(ic_lowpass_filter=filter)
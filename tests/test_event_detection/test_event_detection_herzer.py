@@ -41,11 +41,9 @@ class TestCachingFunctionality(MetaTestConfig, TestCachingMixin):
 class TestEventDetectionHerzer:
     """Test the event detection by Herzer."""
 
-    def test_multi_sensor_input(self, healthy_example_imu_data, healthy_example_stride_borders, snapshot):
+    def test_multi_sensor_input(self, healthy_example_imu_data_fbf, healthy_example_stride_borders, snapshot):
         """Dummy test to see if the algorithm is generally working on the example data."""
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+        data = healthy_example_imu_data_fbf
 
         ed = HerzerEventDetection()
         ed.detect(data, healthy_example_stride_borders, sampling_rate_hz=204.8)
@@ -88,11 +86,9 @@ class TestEventDetectionHerzer:
 
         assert hasattr(ed, "min_vel_event_list_") == output
 
-    def test_multi_sensor_input_dict(self, healthy_example_imu_data, healthy_example_stride_borders):
+    def test_multi_sensor_input_dict(self, healthy_example_imu_data_fbf, healthy_example_stride_borders):
         """Test to see if the algorithm is generally working on the example data when provided as dict."""
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+        data = healthy_example_imu_data_fbf
 
         dict_keys = ["l", "r"]
         data_dict = {dict_keys[0]: data["left_sensor"], dict_keys[1]: data["right_sensor"]}
@@ -107,11 +103,9 @@ class TestEventDetectionHerzer:
         assert list(datatype_helper.get_multi_sensor_names(ed.min_vel_event_list_)) == dict_keys
         assert list(datatype_helper.get_multi_sensor_names(ed.segmented_event_list_)) == dict_keys
 
-    def test_equal_output_dict_df(self, healthy_example_imu_data, healthy_example_stride_borders):
+    def test_equal_output_dict_df(self, healthy_example_imu_data_fbf, healthy_example_stride_borders):
         """Test if output is similar for input dicts or regular multisensor data sets."""
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+        data = healthy_example_imu_data_fbf
 
         ed_df = HerzerEventDetection()
         ed_df.detect(data, healthy_example_stride_borders, sampling_rate_hz=204.8)
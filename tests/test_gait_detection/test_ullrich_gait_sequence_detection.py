@@ -5,21 +5,27 @@ from pandas._testing import assert_frame_equal
 
 from gaitmap.base import BaseType
 from gaitmap.gait_detection import UllrichGaitSequenceDetection
-from gaitmap.utils import coordinate_conversion
 from gaitmap.utils.consts import BF_COLS
 from gaitmap_mad.gait_detection._ullrich_gait_sequence_detection import _gait_sequence_concat
 from tests.mixins.test_algorithm_mixin import TestAlgorithmMixin
 
 
+@pytest.fixture(scope="module")
+def non_gait_signal():
+    """A sine signal (1 Hz, 2048 samples at 204.8 Hz) that mimics cyclic non-gait activity."""
+    t = np.arange(2048) / 204.8
+    signal = np.sin(2 * np.pi * 1 * t) * 200
+    # The signal is shared by all tests of the module and must not be modified.
+    signal.flags.writeable = False
+    return signal
+
+
 class MetaTestConfig:
     algorithm_class = UllrichGaitSequenceDetection
 
     @pytest.fixture()
-    def after_action_instance(self, healthy_example_imu_data) -> BaseType:
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
-        data = data["left_sensor"]
+    def after_action_instance(self, healthy_example_imu_data_fbf) -> BaseType:
+        data = healthy_example_imu_data_fbf["left_sensor"]
         gsd = UllrichGaitSequenceDetection()
         gsd = gsd.detect(data, 204.8)
         return gsd
@@ -32,13 +38,9 @@ class TestMetaFunctionality(MetaTestConfig, TestAlgorithmMixin):
 class TestUllrichGaitSequenceDetection:
     """Test the gait sequence detection by Ullrich."""
 
-    def test_single_sensor_input(self, healthy_example_imu_data, snapshot):
+    def test_single_sensor_input(self, healthy_example_imu_data_fbf, snapshot):
         """Dummy test to see if the algorithm is generally working on the example data."""
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
-
-        data = data["left_sensor"]
+        data = healthy_example_imu_data_fbf["left_sensor"]
 
         gsd = UllrichGaitSequenceDetection()
         gsd = gsd.detect(data, 204.8)
@@ -51,11 +53,9 @@ class TestUllrichGaitSequenceDetection:
         assert isinstance(gsd.start_, np.ndarray)
         assert isinstance(gsd.end_, np.ndarray)
 
-    def test_multi_sensor_input(self, healthy_example_imu_data, snapshot):
+    def test_multi_sensor_input(self, healthy_example_imu_data_fbf, snapshot):
         """Dummy test to see if the algorithm is generally working on the example data."""
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+        data = healthy_example_imu_data_fbf
 
         gsd = UllrichGaitSequenceDetection()
         gsd = gsd.detect(data, 204.8)
@@ -85,7 +85,8 @@ class TestUllrichGaitSequenceDetection:
     )
     def test_different_activities_different_configs(
         self,
-        healthy_example_imu_data,
+        healthy_example_imu_data_fbf,
+        non_gait_signal,
         sensor_channel_config,
         peak_prominence,
         merge_gait_sequences_from_sensors,
@@ -94,26 +95,21 @@ class TestUllrichGaitSequenceDetection:
         """Test if the algorithm is generally working with different sensor channel configs and their respective
         optimal peak prominence thresholds.
         """
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+        data = healthy_example_imu_data_fbf
 
         # induce rest
-        rest_df = pd.DataFrame([[0] * data.shape[1]], columns=data.columns)
-        rest_df = pd.concat([rest_df] * 2048)
+        rest_df = pd.DataFrame(np.zeros((2048, data.shape[1])), columns=data.columns)
 
         # induce non-gait cyclic activity
-        # create a sine signal to mimic non-gait
-        sampling_rate = 204.8
-        samples = 2048
-        t = np.arange(samples) / sampling_rate
-        freq = 1
-        test_signal = np.sin(2 * np.pi * freq * t) * 200
-
-        test_signal_reshaped = np.tile(test_signal, (data.shape[1], 1)).T
+        test_signal_reshaped = np.ascontiguousarray(
+            np.broadcast_to(non_gait_signal[:, None], (len(non_gait_signal), data.shape[1]))
+        )
         non_gait_df = pd.DataFrame(test_signal_reshaped, columns=data.columns)
 
-        test_data_df = pd.concat([rest_df, data, non_gait_df, data, rest_df], ignore_index=True)
+        # All parts have the same columns and dtype, so we can simply stack the values.
+        test_data_df = pd.DataFrame(
+            np.concatenate([df.to_numpy() for df in (rest_df, data, non_gait_df, data, rest_df)]), columns=data.columns
+        )
 
         gsd = UllrichGaitSequenceDetection(
             sensor_channel_config=sensor_channel_config,
@@ -126,13 +122,9 @@ class TestUllrichGaitSequenceDetection:
         assert all(gsd.end_["left_sensor"] == gsd.gait_sequences_["left_sensor"]["end"])
         snapshot.assert_match(gsd.gait_sequences_["left_sensor"], check_dtype=False)
 
-    def test_signal_length_one_window_size(self, healthy_example_imu_data, snapshot):
+    def test_signal_length_one_window_size(self, healthy_example_imu_data_fbf, snapshot):
         """Test to see if the algorithm is working if the signal length equals to one window size."""
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
-
-        data = data["left_sensor"]
+        data = healthy_example_imu_data_fbf["left_sensor"]
 
         sampling_rate_hz = 204.8
         window_size_s = 10
@@ -150,8 +142,7 @@ class TestUllrichGaitSequenceDetection:
         data_columns = BF_COLS
 
         # induce rest
-        rest_df = pd.DataFrame([[0] * 6], columns=data_columns)
-        rest_df = pd.concat([rest_df] * 2048)
+        rest_df = pd.DataFrame(np.zeros((2048, 6)), columns=data_columns)
 
         gsd = UllrichGaitSequenceDetection()
         gsd = gsd.detect(rest_df, 204.8)
@@ -160,19 +151,14 @@ class TestUllrichGaitSequenceDetection:
         assert len(gsd.start_) == 0
         assert len(gsd.end_) == 0
 
-    def test_on_signal_with_only_nongait(self, snapshot):
+    def test_on_signal_with_only_nongait(self, non_gait_signal, snapshot):
         """Test to see if the algorithm is working if the signal contains only non-gait activity."""
         data_columns = BF_COLS
 
         # induce non-gait cyclic activity
-        # create a sine signal to mimic non-gait
-        sampling_rate = 204.8
-        samples = 2048
-        t = np.arange(samples) / sampling_rate
-        freq = 1
-        test_signal = np.sin(2 * np.pi * freq * t) * 200
-
-        test_signal_reshaped = np.tile(test_signal, (6, 1)).T
+        test_signal_reshaped = np.ascontiguousarray(
+            np.broadcast_to(non_gait_signal[:, None], (len(non_gait_signal), 6))
+        )
         non_gait_df = pd.DataFrame(test_signal_reshaped, columns=data_columns)
 
         gsd = UllrichGaitSequenceDetection()
@@ -182,11 +168,9 @@ class TestUllrichGaitSequenceDetection:
         assert len(gsd.start_) == 0
         assert len(gsd.end_) == 0
 
-    def test_invalid_sensor_channel_config_type(self, healthy_example_imu_data):
+    def test_invalid_sensor_channel_config_type(self, healthy_example_imu_data_fbf):
         """Check if ValueError is raised for wrong sensor_channel_config data type."""
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+        data = healthy_example_imu_data_fbf
         # use an int instead of str or list
         sensor_channel_config = 1
         with pytest.raises(TypeError, match=r".* must be a str."):
@@ -194,21 +178,17 @@ class TestUllrichGaitSequenceDetection:
             gsd.detect(data, 204.8)
 
     @pytest.mark.parametrize("sensor_channel_config", "dummy")
-    def test_invalid_sensor_channel_config_value(self, healthy_example_imu_data, sensor_channel_config):
+    def test_invalid_sensor_channel_config_value(self, healthy_example_imu_data_fbf, sensor_channel_config):
         """Check if ValueError is raised for wrong sensor_channel_config data type."""
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+        data = healthy_example_imu_data_fbf
 
         with pytest.raises(ValueError, match=r".* you have passed is invalid. .*"):
             gsd = UllrichGaitSequenceDetection(sensor_channel_config=sensor_channel_config)
             gsd.detect(data, 204.8)
 
-    def test_invalid_window_size(self, healthy_example_imu_data):
+    def test_invalid_window_size(self, healthy_example_imu_data_fbf):
         """Check if ValueError is raised for window size higher than len of signal."""
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+        data = healthy_example_imu_data_fbf
 
         # cut the data to 500 samples
         data = data.iloc[0:500]
@@ -218,32 +198,26 @@ class TestUllrichGaitSequenceDetection:
             gsd.detect(data, 204.8)
 
     @pytest.mark.parametrize("locomotion_band", ([1], (0, 1, 2)))
-    def test_invalid_locomotion_band_size(self, healthy_example_imu_data, locomotion_band):
+    def test_invalid_locomotion_band_size(self, healthy_example_imu_data_fbf, locomotion_band):
         """Check if ValueError is raised for locomotion band with other than two values."""
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+        data = healthy_example_imu_data_fbf
 
         with pytest.raises(ValueError, match=r".* exactly two values."):
             gsd1 = UllrichGaitSequenceDetection(locomotion_band=locomotion_band)
             gsd1.detect(data, 204.8)
 
     @pytest.mark.parametrize("locomotion_band", ((3, 0.5), (0.5, 0.5)))
-    def test_invalid_locomotion_value_order(self, healthy_example_imu_data, locomotion_band):
+    def test_invalid_locomotion_value_order(self, healthy_example_imu_data_fbf, locomotion_band):
         """Check if ValueError is raised for locomotion band where second value is smaller or equal than first."""
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+        data = healthy_example_imu_data_fbf
 
         with pytest.raises(ValueError, match=r".* smaller than the second value."):
             gsd = UllrichGaitSequenceDetection(locomotion_band=locomotion_band)
             gsd.detect(data, 204.8)
 
-    def test_invalid_locomotion_upper_value(self, healthy_example_imu_data):
+    def test_invalid_locomotion_upper_value(self, healthy_example_imu_data_fbf):
         """Check if ValueError is raised for locomotion band where the upper limit is too close to Nyquist freq."""
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+        data = healthy_example_imu_data_fbf
 
         locomotion_band = (3, 100)
         with pytest.raises(ValueError, match=r".* Nyquist frequency .*"):
@@ -251,23 +225,19 @@ class TestUllrichGaitSequenceDetection:
             gsd.detect(data, 204.8)
 
     @pytest.mark.parametrize("harmonic_tolerance_hz", (-3, 0))
-    def test_invalid_harmonic_tolerance(self, healthy_example_imu_data, harmonic_tolerance_hz):
+    def test_invalid_harmonic_tolerance(self, healthy_example_imu_data_fbf, harmonic_tolerance_hz):
         """Check if ValueError is raised for harmonic tolerance of being too small Hz."""
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+        data = healthy_example_imu_data_fbf
 
         with pytest.raises(ValueError, match=r"Value for harmonic_tolerance_hz too small. .*"):
             gsd_1 = UllrichGaitSequenceDetection(harmonic_tolerance_hz=harmonic_tolerance_hz)
             gsd_1.detect(data, 204.8)
 
-    def test_invalid_merging_gait_sequences(self, healthy_example_imu_data):
+    def test_invalid_merging_gait_sequences(self, healthy_example_imu_data_fbf):
         """Check if data and value for merge_gait_sequences_from_sensors fit to each other. Only gait sequences detected
         from synced data can be merge.
         """
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+        data = healthy_example_imu_data_fbf
 
         # create dict of dfs to mock up non-synced data
         data_dict = {"left": data["left_sensor"], "right": data["right_sensor"]}
@@ -276,11 +246,9 @@ class TestUllrichGaitSequenceDetection:
             gsd = UllrichGaitSequenceDetection(merge_gait_sequences_from_sensors=merge_gait_sequences_from_sensors)
             gsd.detect(data_dict, 204.8)
 
-    def test_merging_gait_sequences(self, healthy_example_imu_data):
+    def test_merging_gait_sequences(self, healthy_example_imu_data_fbf):
         """Check if merging of gait sequences works for synchronized data."""
-        data = coordinate_conversion.convert_to_fbf(
-            healthy_example_imu_data, left=["left_sensor"], right=["right_sensor"]
-        )
+        data = healthy_example_imu_data_fbf
 
         # if merging is turned off, result will be a dict with different pd.DataFrames as entries
         merge_gait_sequences_from_sensors = False
@@ -303,8 +271,7 @@ class TestUllrichGaitSequenceDetection:
         data_columns = BF_COLS
 
         # induce rest
-        rest_df = pd.DataFrame([[0] * 6], columns=data_columns)
-        rest_df = pd.concat([rest_df] * 2048)
+        rest_df = pd.DataFrame(np.zeros((2048, 6)), columns=data_columns)
 
         dict_of_df = {"left_sensor": rest_df, "right_sensor": rest_df}
         synced_rest_df = pd.concat(dict_of_df, axis=1)
@@ -318,19 +285,14 @@ class TestUllrichGaitSequenceDetection:
         for sensor in ["left_sensor", "right_sensor"]:
             assert gsd.gait_sequences_[sensor].empty
 
-    def test_merging_on_signal_with_only_nongait(self):
+    def test_merging_on_signal_with_only_nongait(self, non_gait_signal):
         """Test to see if the merging is working if the signal contains only non-gait activity."""
         data_columns = BF_COLS
 
         # induce non-gait cyclic activity
-        # create a sine signal to mimic non-gait
-        sampling_rate = 204.8
-        samples = 2048
-        t = np.arange(samples) / sampling_rate
-        freq = 1
-        test_signal = np.sin(2 * np.pi * freq * t) * 200
-
-        test_signal_reshaped = np.tile(test_signal, (6, 1)).T
+        test_signal_reshaped = np.ascontiguousarray(
+            np.broadcast_to(non_gait_signal[:, None], (len(non_gait_signal), 6))
+        )
         non_gait_df = pd.DataFrame(test_signal_reshaped, columns=data_columns)
 
         dict_of_df = {"left_sensor": non_gait_df, "right_sensor": non_gait_df}
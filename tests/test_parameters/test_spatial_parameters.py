@@ -2,16 +2,21 @@ import numpy as np
 import pandas as pd
 import pytest
 from pandas._testing import assert_series_equal
+from scipy.spatial.transform import Rotation
 
 from gaitmap.base import BaseType
 from gaitmap.parameters import SpatialParameterCalculation
 from gaitmap.parameters._spatial_parameters import (
     _calc_arc_length,
+    _calc_max_lateral_excursion,
     _calc_stride_length,
     _calc_turning_angle,
     _compute_sole_angle_course,
+    _rotate_x_axis,
+    _twist_angle_around_z,
 )
 from gaitmap.utils.exceptions import ValidationError
+from gaitmap.utils.rotations import find_angle_between_orientations
 from tests.mixins.test_algorithm_mixin import TestAlgorithmMixin
 
 
@@ -119,9 +124,46 @@ class TestIndividualParameter:
     def test_stride_length(self, single_sensor_position_list_with_index, single_sensor_stride_length):
         assert_series_equal(_calc_stride_length(single_sensor_position_list_with_index), single_sensor_stride_length)
 
+    def test_stride_length_nan_at_stride_border(self, single_sensor_position_list_with_index):
+        """NaN values at the start or end of a stride are skipped, like `groupby().first()/.last()` does."""
+        positions = single_sensor_position_list_with_index.astype(float)
+        positions.loc[(0, 0), "pos_x"] = np.nan
+        positions.loc[(1, 2), "pos_y"] = np.nan
+
+        expected = pd.Series([1, np.sqrt(5), 0], index=pd.Index([0, 1, 2], name="s_id"))
+        assert_series_equal(_calc_stride_length(positions), expected, check_dtype=False)
+
+    def test_max_lateral_excursion_nan_at_stride_border(self):
+        """Compare against the groupby based reference implementation for strides with NaN border samples."""
+        rng = np.random.default_rng(0)
+        index = pd.MultiIndex.from_product([range(4), range(6)], names=["s_id", "sample"])
+        positions = pd.DataFrame(rng.normal(size=(24, 3)), index=index, columns=["pos_x", "pos_y", "pos_z"])
+        positions.loc[(0, 0), "pos_x"] = np.nan
+        positions.loc[(1, 5), ["pos_x", "pos_y"]] = np.nan
+        positions.loc[(2, 0), "pos_y"] = np.nan
+        positions.loc[(2, 5), "pos_x"] = np.nan
+
+        start = positions.groupby(level="s_id").first()
+        end = positions.groupby(level="s_id").last()
+        stride_length = _calc_stride_length(positions)
+        excursion = (
+            (end["pos_x"] - start["pos_x"]) * (start["pos_y"] - positions["pos_y"])
+            - (start["pos_x"] - positions["pos_x"]) * (end["pos_y"] - start["pos_y"])
+        ).abs()
+        expected = excursion.groupby(level="s_id").max() / stride_length
+
+        out = _calc_max_lateral_excursion(positions)
+
+        assert not out.isna().any()
+        assert_series_equal(out, expected, check_names=False)
+
     def test_arc_length(self, single_sensor_position_list_with_index, single_sensor_arc_length):
         assert_series_equal(_calc_arc_length(single_sensor_position_list_with_index), single_sensor_arc_length)
 
+    def test_arc_length_unsorted_strides(self, single_sensor_position_list_with_index, single_sensor_arc_length):
+        shuffled = single_sensor_position_list_with_index.iloc[[6, 0, 7, 3, 1, 4, 8, 2, 5]]
+        assert_series_equal(_calc_arc_length(shuffled), single_sensor_arc_length)
+
     def test_turning_angle(self, single_sensor_orientation_list_with_index, single_sensor_turning_angle):
         assert_series_equal(
             _calc_turning_angle(single_sensor_orientation_list_with_index),
@@ -129,6 +171,27 @@ class TestIndividualParameter:
             check_exact=False,
         )
 
+    def test_turning_angle_nan_at_stride_border(
+        self, single_sensor_orientation_list_with_index, single_sensor_turning_angle
+    ):
+        """NaN values at the start or end of a stride are skipped, like `groupby().first()/.last()` does."""
+        nan_row = pd.DataFrame(
+            np.nan,
+            index=pd.MultiIndex.from_tuples([(1, -1), (2, 3)], names=["s_id", "sample"]),
+            columns=single_sensor_orientation_list_with_index.columns,
+        )
+        orientations = pd.concat([single_sensor_orientation_list_with_index, nan_row]).sort_index()
+
+        assert_series_equal(_calc_turning_angle(orientations), single_sensor_turning_angle, check_exact=False)
+
+    def test_twist_angle_around_z(self):
+        ori = Rotation.random(20, random_state=0)
+        ref = Rotation.random(20, random_state=1)
+        np.testing.assert_array_almost_equal(
+            _twist_angle_around_z(ori.as_quat(), ref.as_quat() * 2),
+            find_angle_between_orientations(ori, ref, np.asarray([0, 0, 1])),
+        )
+
     def test_turning_angle_empty_orientation(self):
         """Test the turning angle computation in case of empty orientation input.
 
@@ -152,6 +215,18 @@ class TestIndividualParameter:
             _compute_sole_angle_course(single_sensor_orientation_list_with_index), single_sensor_sole_angle_course
         )
 
+    def test_sole_angle_object_dtype(self, single_sensor_orientation_list_with_index, single_sensor_sole_angle_course):
+        assert_series_equal(
+            _compute_sole_angle_course(single_sensor_orientation_list_with_index.astype(object)),
+            single_sensor_sole_angle_course,
+        )
+
+    def test_rotate_x_axis(self):
+        quaternions = Rotation.random(20, random_state=0).as_quat() * 3
+        np.testing.assert_array_almost_equal(
+            _rotate_x_axis(quaternions), Rotation.from_quat(quaternions).apply([1, 0, 0])
+        )
+
     def test_sole_angle_empty_orientation(self):
         """Test the sole angle computation in case of empty orientation input.
 
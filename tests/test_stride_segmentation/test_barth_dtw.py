@@ -7,7 +7,6 @@ from pandas.testing import assert_frame_equal
 
 from gaitmap.base import BaseType
 from gaitmap.stride_segmentation import BarthDtw, DtwTemplate
-from gaitmap.utils.coordinate_conversion import convert_to_fbf
 from gaitmap.utils.datatype_helper import is_multi_sensor_stride_list, is_single_sensor_stride_list
 from tests.mixins.test_algorithm_mixin import TestAlgorithmMixin
 from tests.mixins.test_caching_mixin import TestCachingMixin
@@ -39,8 +38,8 @@ class TestCachingFunctionality(MetaTestConfig, TestCachingMixin):
 
 
 class TestRegressionOnRealData:
-    def test_real_data_both_feed_regression(self, healthy_example_imu_data, snapshot):
-        data = convert_to_fbf(healthy_example_imu_data, right=["right_sensor"], left=["left_sensor"])
+    def test_real_data_both_feed_regression(self, healthy_example_imu_data_fbf, snapshot):
+        data = healthy_example_imu_data_fbf
         dtw = BarthDtw()  # Test with default paras
         dtw.segment(data, sampling_rate_hz=204.8)
 
@@ -50,8 +49,8 @@ class TestRegressionOnRealData:
         snapshot.assert_match(dtw.stride_list_["left_sensor"], "left")
         snapshot.assert_match(dtw.stride_list_["right_sensor"], "right")
 
-    def test_snapping_on_off(self, healthy_example_imu_data):
-        data = convert_to_fbf(healthy_example_imu_data, right=["right_sensor"], left=["left_sensor"]).iloc[:1000]
+    def test_snapping_on_off(self, healthy_example_imu_data_fbf):
+        data = healthy_example_imu_data_fbf.iloc[:1000]
         # off
         dtw = BarthDtw(snap_to_min_win_ms=None)
         dtw.segment(data, sampling_rate_hz=204.8)
@@ -69,8 +68,8 @@ class TestRegressionOnRealData:
         assert not np.array_equal(dtw.matches_start_end_["left_sensor"], dtw.matches_start_end_original_["left_sensor"])
         assert_array_equal(dtw.matches_start_end_original_["left_sensor"], out_without_snapping)
 
-    def test_conflict_resolution_on_off(self, healthy_example_imu_data):
-        data = convert_to_fbf(healthy_example_imu_data, right=["right_sensor"], left=["left_sensor"]).iloc[:1000]
+    def test_conflict_resolution_on_off(self, healthy_example_imu_data_fbf):
+        data = healthy_example_imu_data_fbf.iloc[:1000]
         # For both cases set the threshold so high that wrong matches will occure
         max_cost = 5
         min_match_length_s = 0.1
@@ -333,8 +332,8 @@ class TestPostProcessing:
         # Check that the correct 5 strides were identified
         assert np.all(~to_keep[bad_strides])
 
-    def test_post_post_warning_is_raised(self, healthy_example_imu_data):
-        data = convert_to_fbf(healthy_example_imu_data, right=["right_sensor"], left=["left_sensor"])[:1000]
+    def test_post_post_warning_is_raised(self, healthy_example_imu_data_fbf):
+        data = healthy_example_imu_data_fbf[:1000]
         # Disable all conflict resolutions to force a double match
         dtw = BarthDtw(max_cost=10000, min_match_length_s=None, conflict_resolution=False, snap_to_min_win_ms=None)
 
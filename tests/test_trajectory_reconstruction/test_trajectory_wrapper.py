@@ -3,15 +3,15 @@ from typing import Dict, Type
 import numpy as np
 import pandas as pd
 import pytest
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_almost_equal, assert_array_equal
 from scipy.spatial.transform import Rotation
 from typing_extensions import Literal
 
 from gaitmap.base import BaseTrajectoryMethod, BaseTrajectoryReconstructionWrapper
-from gaitmap.trajectory_reconstruction import RegionLevelTrajectory, RtsKalman
+from gaitmap.trajectory_reconstruction import RegionLevelTrajectory, RtsKalman, SimpleGyroIntegration
 from gaitmap.trajectory_reconstruction._stride_level_trajectory import StrideLevelTrajectory
-from gaitmap.trajectory_reconstruction._trajectory_wrapper import _initial_orientation_from_start
-from gaitmap.utils.consts import GF_POS, GF_VEL, SF_COLS
+from gaitmap.trajectory_reconstruction._trajectory_wrapper import _initial_orientations_from_starts
+from gaitmap.utils.consts import GF_POS, GF_VEL, SF_ACC, SF_COLS
 from gaitmap.utils.datatype_helper import (
     is_multi_sensor_orientation_list,
     is_multi_sensor_position_list,
@@ -19,6 +19,7 @@ from gaitmap.utils.datatype_helper import (
     is_single_sensor_position_list,
 )
 from gaitmap.utils.exceptions import ValidationError
+from gaitmap.utils.rotations import get_gravity_rotation
 
 
 class TestIODataStructures:
@@ -121,6 +122,44 @@ class TestIODataStructures:
         snapshot.assert_match(instance.orientation_.loc[first_last_stride], "ori")
         snapshot.assert_match(instance.position_.loc[first_last_stride], "pos")
 
+    def test_input_data_not_modified(self, healthy_example_imu_data):
+        """The regions are passed to the methods as views, so the methods must not change the original data."""
+        test_stride_events = self.example_region["left_sensor"].iloc[:5]
+        test_data = healthy_example_imu_data["left_sensor"].iloc[: int(test_stride_events.iloc[-1]["end"]) + 10]
+        original_data = test_data.copy()
+
+        self.wrapper_class().estimate(test_data, test_stride_events, sampling_rate_hz=204.8)
+
+        pd.testing.assert_frame_equal(test_data, original_data)
+
+    def test_additional_non_numeric_column(self, healthy_example_imu_data):
+        """Additional columns of the sensor data are allowed and must not be converted to float."""
+        test_stride_events = self.example_region["left_sensor"].iloc[:5]
+        test_data = healthy_example_imu_data["left_sensor"].iloc[: int(test_stride_events.iloc[-1]["end"]) + 10]
+        labeled_data = test_data.assign(label="x")
+
+        expected = self.wrapper_class().estimate(test_data, test_stride_events, sampling_rate_hz=204.8)
+        instance = self.wrapper_class().estimate(labeled_data, test_stride_events, sampling_rate_hz=204.8)
+
+        pd.testing.assert_frame_equal(instance.orientation_, expected.orientation_)
+        pd.testing.assert_frame_equal(instance.position_, expected.position_)
+
+    def test_methods_not_modified(self, healthy_example_imu_data):
+        """The methods are reused for all regions, but this must only happen on clones of the provided instances."""
+        test_stride_events = self.example_region["left_sensor"].iloc[:5]
+        test_data = healthy_example_imu_data["left_sensor"]
+        initial_orientation = np.array([0, 0, 0, 1.0])
+        ori_method = SimpleGyroIntegration(initial_orientation=initial_orientation)
+
+        instance = self.wrapper_class(ori_method=ori_method).estimate(
+            test_data, test_stride_events, sampling_rate_hz=204.8
+        )
+
+        assert instance.ori_method is ori_method
+        assert ori_method.initial_orientation is initial_orientation
+        assert not hasattr(ori_method, "orientation_object_")
+        assert not hasattr(instance.pos_method, "position_")
+
     def test_single_sensor_output_empty_stride_list(self, healthy_example_imu_data):
         empty_stride_events = pd.DataFrame(columns=self.example_region["left_sensor"].columns)
         test_data = healthy_example_imu_data["left_sensor"]
@@ -165,6 +204,18 @@ class TestIODataStructures:
             snapshot.assert_match(instance.orientation_[sensor].loc[first_last_stride], f"ori_{sensor}")
             snapshot.assert_match(instance.position_[sensor].loc[first_last_stride], f"pos_{sensor}")
 
+    def test_multi_sensor_parallel(self, healthy_example_imu_data):
+        """Processing the sensors in parallel must give the same results as processing them sequentially."""
+        test_stride_events = {k: v.iloc[:5] for k, v in self.example_region.items()}
+        test_data = healthy_example_imu_data
+
+        sequential = self.wrapper_class().estimate(test_data, test_stride_events, sampling_rate_hz=204.8)
+        parallel = self.wrapper_class(n_jobs=2).estimate(test_data, test_stride_events, sampling_rate_hz=204.8)
+
+        for sensor in test_stride_events:
+            for result in ("orientation_", "velocity_", "position_"):
+                pd.testing.assert_frame_equal(getattr(parallel, result)[sensor], getattr(sequential, result)[sensor])
+
 
 class TestInitCalculation:
     """Test the calculation of initial rotations per stride.
@@ -175,7 +226,7 @@ class TestInitCalculation:
     def test_calc_initial_dummy(self):
         """No rotation expected as already aligned."""
         dummy_data = pd.DataFrame(np.repeat(np.array([0, 0, 1, 0, 0, 0])[None, :], 20, axis=0), columns=SF_COLS)
-        start_ori = _initial_orientation_from_start(dummy_data, 10, 8)
+        start_ori = _initial_orientations_from_starts(dummy_data, np.array([10]), 8)[0]
         assert_array_equal(start_ori.as_quat(), Rotation.identity().as_quat())
 
     @pytest.mark.parametrize("start", [0, 99])
@@ -183,15 +234,31 @@ class TestInitCalculation:
         """If start is to close to the start or the end of the data a warning is emitted."""
         dummy_data = pd.DataFrame(np.repeat(np.array([0, 0, 1, 0, 0, 0])[None, :], 100, axis=0), columns=SF_COLS)
         with pytest.warns(UserWarning) as w:
-            _initial_orientation_from_start(dummy_data, start, 8)
+            _initial_orientations_from_starts(dummy_data, np.array([start]), 8)
 
         assert "complete window length" in str(w[0])
 
     def test_only_single_value(self):
         dummy_data = pd.DataFrame(np.repeat(np.array([0, 0, 1, 0, 0, 0])[None, :], 20, axis=0), columns=SF_COLS)
-        start_ori = _initial_orientation_from_start(dummy_data, 10, 0)
+        start_ori = _initial_orientations_from_starts(dummy_data, np.array([10]), 0)[0]
         assert_array_equal(start_ori.as_quat(), Rotation.identity().as_quat())
 
+    def test_multiple_starts(self):
+        """All windows are aligned individually, even if they are cut at the border or contain NaNs."""
+        rng = np.random.default_rng(0)
+        dummy_data = pd.DataFrame(rng.normal(size=(30, 6)) + np.array([0, 0, 5, 0, 0, 0]), columns=SF_COLS)
+        dummy_data.iloc[12, 1] = np.nan
+        starts = np.array([0, 3, 10, 15, 29])
+        with pytest.warns(UserWarning):
+            start_oris = _initial_orientations_from_starts(dummy_data, starts, 8)
+        expected = [
+            get_gravity_rotation(dummy_data[SF_ACC].iloc[max(start - 4, 0) : start + 5].median()).as_quat()
+            for start in starts
+        ]
+
+        assert len(start_oris) == len(starts)
+        assert_almost_equal(start_oris.as_quat(), np.array(expected))
+
 
 class MockTrajectory(BaseTrajectoryMethod):
     def __init__(self, initial_orientation=None):
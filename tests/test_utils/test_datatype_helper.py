@@ -1,4 +1,8 @@
 """Test the dataset helpers."""
+import itertools
+from functools import lru_cache
+from typing import Iterator, Tuple
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -42,18 +46,71 @@ from gaitmap.utils.datatype_helper import (
 from gaitmap.utils.exceptions import ValidationError
 
 
-def _create_test_multiindex():
-    return pd.MultiIndex.from_product([list("abc"), list("123")])
+# Indices are immutable, so the same test index can be used by all tests.
+_TEST_MULTIINDEX = pd.MultiIndex.from_product([list("abc"), list("123")])
 
 
-@pytest.fixture(params=(("both", True, True), ("acc", True, False), ("gyr", False, True)))
-def combinations(request):
-    return request.param
+@lru_cache(maxsize=None)
+def _single_sensor_df(cols: Tuple[str, ...]) -> pd.DataFrame:
+    """Get an empty single sensor dataframe with the given columns.
 
+    The dataframe is only created once and shared between all tests, so it must not be modified.
+    """
+    return pd.DataFrame(columns=list(cols))
 
-@pytest.fixture(params=("any", "body", "sensor"))
-def frame(request):
-    return request.param
+
+@lru_cache(maxsize=None)
+def _indexed_single_sensor_df(cols: Tuple[str, ...], index: Tuple[str, ...]) -> pd.DataFrame:
+    """Get an empty single sensor dataframe with the given columns and the given index columns.
+
+    The dataframe is only created once and shared between all tests, so it must not be modified.
+    """
+    df = _single_sensor_df((*cols, *index))
+    if index:
+        df = df.set_index(list(index))
+    return df
+
+
+@lru_cache(maxsize=None)
+def _multi_sensor_df(cols: Tuple[str, ...]) -> pd.DataFrame:
+    """Get a multi sensor dataframe with the sensors "a" and "b" and the given columns.
+
+    The dataframe is only created once and shared between all tests, so it must not be modified.
+    """
+    return pd.DataFrame([[*range(len(cols) * 2)]], columns=pd.MultiIndex.from_product((("a", "b"), cols)))
+
+
+# Values that are not valid for any of the (multi sensor) datatypes.
+# They are never modified by the validation functions and can hence be shared by all tests.
+_WRONG_DATATYPES = (list(range(6)), "test", np.arange(6), {}, pd.DataFrame(), pd.DataFrame(columns=[*range(3)]))
+
+# The column sets of stride lists and the stride types they are valid for.
+# `pd.Index` is used, as it is immutable and can be safely shared by all tests.
+_STRIDE_LIST_COLS = pd.Index(["s_id", "start", "end", "gsd_id"])
+_MIN_VEL_STRIDE_LIST_COLS = _STRIDE_LIST_COLS.append(pd.Index(["pre_ic", "ic", "min_vel", "tc"]))
+_IC_STRIDE_LIST_COLS = _STRIDE_LIST_COLS.append(pd.Index(["ic", "min_vel", "tc"]))
+_STRIDE_LIST_COL_CASES = (
+    (_STRIDE_LIST_COLS, ["any"]),
+    (_MIN_VEL_STRIDE_LIST_COLS, ["segmented", "min_vel", "ic"]),
+    (_IC_STRIDE_LIST_COLS, ["ic", "segmented"]),
+)
+
+
+def _stride_list_variants(cols: pd.Index) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """Yield empty stride lists with the given columns that must all pass/fail the validation in the same way.
+
+    Additional columns are ignored and the s_id can either be a column or the index.
+    """
+    for extra in ([], ["something_extra"]):
+        df = _single_sensor_df((*cols, *extra))
+        yield f"s_id as column, additional columns: {extra}", df
+        yield f"s_id as index, additional columns: {extra}", df.set_index("s_id")
+
+
+# All combinations of the `check_acc`/`check_gyr` and `frame` arguments of the dataset checks
+_DATASET_CHECK_ARGS = tuple(
+    itertools.product((("both", True, True), ("acc", True, False), ("gyr", False, True)), ("any", "body", "sensor"))
+)
 
 
 @pytest.fixture(params=("any", "min_vel", "ic", "segmented"))
@@ -66,15 +123,10 @@ def roi_types(request):
     return request.param
 
 
-@pytest.fixture(params=(True, False))
-def as_index(request):
-    return request.param
-
-
 class TestIsSingleSensorDataset:
     @pytest.mark.parametrize(
         "value",
-        ({"test": pd.DataFrame}, list(range(6)), "test", np.arange(6), pd.DataFrame(columns=_create_test_multiindex())),
+        ({"test": pd.DataFrame}, list(range(6)), "test", np.arange(6), pd.DataFrame(columns=_TEST_MULTIINDEX)),
     )
     def test_wrong_datatype(self, value):
         assert not is_single_sensor_data(value, check_acc=False, check_gyr=False)
@@ -93,18 +145,18 @@ class TestIsSingleSensorDataset:
             (SF_ACC, "sensor", "acc"),
         ),
     )
-    def test_correct_columns(self, cols, frame_valid, col_check_valid, combinations, frame):
+    def test_correct_columns(self, cols, frame_valid, col_check_valid):
         """Test all possible combinations of inputs."""
-        col_check, check_acc, check_gyro = combinations
-        output = is_single_sensor_data(
-            pd.DataFrame(columns=cols), check_acc=check_acc, check_gyr=check_gyro, frame=frame
-        )
+        for (col_check, check_acc, check_gyro), frame in _DATASET_CHECK_ARGS:
+            output = is_single_sensor_data(
+                _single_sensor_df(tuple(cols)), check_acc=check_acc, check_gyr=check_gyro, frame=frame
+            )
 
-        valid_frame = (frame_valid == frame) or (frame == "any")
-        valid_cols = (col_check == col_check_valid) or (col_check_valid == "both")
-        expected_outcome = valid_cols and valid_frame
+            valid_frame = (frame_valid == frame) or (frame == "any")
+            valid_cols = (col_check == col_check_valid) or (col_check_valid == "both")
+            expected_outcome = valid_cols and valid_frame
 
-        assert output == expected_outcome
+            assert output == expected_outcome, f"col_check={col_check}, frame={frame}"
 
     def test_invalid_frame_argument(self):
         with pytest.raises(ValueError):
@@ -119,16 +171,13 @@ class TestIsSingleSensorDataset:
 
 
 class TestIsMultiSensorDataset:
-    @pytest.mark.parametrize(
-        "value",
-        (list(range(6)), "test", np.arange(6), {}, pd.DataFrame(), pd.DataFrame(columns=[*range(3)])),
-    )
+    @pytest.mark.parametrize("value", _WRONG_DATATYPES)
     def test_wrong_datatype(self, value):
         assert not is_multi_sensor_data(value, check_acc=False, check_gyr=False)
 
     def test_correct_datatype(self):
         assert is_multi_sensor_data(
-            pd.DataFrame([[*range(9)]], columns=_create_test_multiindex()), check_acc=False, check_gyr=False
+            pd.DataFrame([[*range(9)]], columns=_TEST_MULTIINDEX), check_acc=False, check_gyr=False
         )
 
     @pytest.mark.parametrize(
@@ -142,25 +191,25 @@ class TestIsMultiSensorDataset:
             (SF_ACC, "sensor", "acc"),
         ),
     )
-    def test_correct_columns(self, cols, frame_valid, col_check_valid, combinations, frame):
+    def test_correct_columns(self, cols, frame_valid, col_check_valid):
         """Test all possible combinations of inputs."""
-        col_check, check_acc, check_gyro = combinations
-        output = is_multi_sensor_data(
-            pd.DataFrame([[*range(len(cols) * 2)]], columns=pd.MultiIndex.from_product((("a", "b"), cols))),
-            check_acc=check_acc,
-            check_gyr=check_gyro,
-            frame=frame,
-        )
+        for (col_check, check_acc, check_gyro), frame in _DATASET_CHECK_ARGS:
+            output = is_multi_sensor_data(
+                _multi_sensor_df(tuple(cols)),
+                check_acc=check_acc,
+                check_gyr=check_gyro,
+                frame=frame,
+            )
 
-        valid_frame = (frame_valid == frame) or (frame == "any")
-        valid_cols = (col_check == col_check_valid) or (col_check_valid == "both")
-        expected_outcome = valid_cols and valid_frame
+            valid_frame = (frame_valid == frame) or (frame == "any")
+            valid_cols = (col_check == col_check_valid) or (col_check_valid == "both")
+            expected_outcome = valid_cols and valid_frame
 
-        assert output == expected_outcome
+            assert output == expected_outcome, f"col_check={col_check}, frame={frame}"
 
     def test_invalid_frame_argument(self):
         with pytest.raises(ValueError):
-            is_multi_sensor_data(pd.DataFrame([[*range(9)]], columns=_create_test_multiindex()), frame="invalid_value")
+            is_multi_sensor_data(pd.DataFrame([[*range(9)]], columns=_TEST_MULTIINDEX), frame="invalid_value")
 
     def test_error_raising(self):
         with pytest.raises(ValidationError) as e:
@@ -195,7 +244,7 @@ class TestIsDataset:
 
 
 class TestGetMultiSensorDatasetNames:
-    @pytest.mark.parametrize("obj", ({"a": [], "b": [], "c": []}, pd.DataFrame(columns=_create_test_multiindex())))
+    @pytest.mark.parametrize("obj", ({"a": [], "b": [], "c": []}, pd.DataFrame(columns=_TEST_MULTIINDEX)))
     def test_names_simple(self, obj):
         assert set(get_multi_sensor_names(obj)) == {"a", "b", "c"}
 
@@ -204,41 +253,20 @@ class TestIsSingleSensorStrideList:
     @pytest.mark.parametrize(
         "value",
         (
-            list(range(6)),
-            "test",
-            np.arange(6),
-            {},
-            pd.DataFrame(),
-            pd.DataFrame(columns=[*range(3)]),
-            pd.DataFrame([[*range(9)]], columns=_create_test_multiindex()),
+            *_WRONG_DATATYPES,
+            pd.DataFrame([[*range(9)]], columns=_TEST_MULTIINDEX),
         ),
     )
     def test_wrong_datatype(self, value):
         assert not is_single_sensor_stride_list(value)
 
-    @pytest.mark.parametrize(
-        ("cols", "stride_types_valid"),
-        (
-            (["s_id", "start", "end", "gsd_id"], ["any"]),
-            (["s_id", "start", "end", "gsd_id", "something_extra"], ["any"]),
-            (["s_id", "start", "end", "gsd_id", "pre_ic", "ic", "min_vel", "tc"], ["segmented", "min_vel", "ic"]),
-            (
-                ["s_id", "start", "end", "gsd_id", "pre_ic", "ic", "min_vel", "tc", "something_extra"],
-                ["segmented", "min_vel", "ic"],
-            ),
-            (["s_id", "start", "end", "gsd_id", "ic", "min_vel", "tc"], ["ic", "segmented"]),
-            (["s_id", "start", "end", "gsd_id", "ic", "min_vel", "tc", "something_extra"], ["ic", "segmented"]),
-        ),
-    )
-    def test_valid_versions(self, cols, stride_types_valid, stride_types, as_index):
+    @pytest.mark.parametrize(("cols", "stride_types_valid"), _STRIDE_LIST_COL_CASES)
+    def test_valid_versions(self, cols, stride_types_valid, stride_types):
         expected_outcome = stride_types in stride_types_valid or stride_types == "any"
-        df = pd.DataFrame(columns=cols)
-        if as_index:
-            df = df.set_index("s_id")
-
-        out = is_single_sensor_stride_list(df, stride_type=stride_types)
+        for name, stride_list in _stride_list_variants(cols):
+            out = is_single_sensor_stride_list(stride_list, stride_type=stride_types)
 
-        assert expected_outcome == out
+            assert expected_outcome == out, name
 
     @pytest.mark.parametrize("check_additional_cols", (True, False, ("ic",)))
     def test_check_additional_columns(self, check_additional_cols):
@@ -314,36 +342,17 @@ class TestIsSingleSensorStrideList:
 
 
 class TestIsMultiSensorStrideList:
-    @pytest.mark.parametrize(
-        "value",
-        (list(range(6)), "test", np.arange(6), {}, pd.DataFrame(), pd.DataFrame(columns=[*range(3)])),
-    )
+    @pytest.mark.parametrize("value", _WRONG_DATATYPES)
     def test_wrong_datatype(self, value):
         assert not is_multi_sensor_stride_list(value)
 
-    @pytest.mark.parametrize(
-        ("cols", "stride_types_valid"),
-        (
-            (["s_id", "start", "end", "gsd_id"], ["any"]),
-            (["s_id", "start", "end", "gsd_id", "something_extra"], ["any"]),
-            (["s_id", "start", "end", "gsd_id", "pre_ic", "ic", "min_vel", "tc"], ["segmented", "min_vel", "ic"]),
-            (
-                ["s_id", "start", "end", "gsd_id", "pre_ic", "ic", "min_vel", "tc", "something_extra"],
-                ["segmented", "min_vel", "ic"],
-            ),
-            (["s_id", "start", "end", "gsd_id", "ic", "min_vel", "tc"], ["ic", "segmented"]),
-            (["s_id", "start", "end", "gsd_id", "ic", "min_vel", "tc", "something_extra"], ["ic", "segmented"]),
-        ),
-    )
-    def test_valid_versions(self, cols, stride_types_valid, stride_types, as_index):
+    @pytest.mark.parametrize(("cols", "stride_types_valid"), _STRIDE_LIST_COL_CASES)
+    def test_valid_versions(self, cols, stride_types_valid, stride_types):
         expected_outcome = stride_types in stride_types_valid or stride_types == "any"
-        df = pd.DataFrame(columns=cols)
-        if as_index:
-            df = df.set_index("s_id")
+        for name, stride_list in _stride_list_variants(cols):
+            out = is_multi_sensor_stride_list({"s1": stride_list}, stride_type=stride_types)
 
-        out = is_multi_sensor_stride_list({"s1": df}, stride_type=stride_types)
-
-        assert expected_outcome == out
+            assert expected_outcome == out, name
 
     def test_only_one_invalid(self):
         valid_cols = ["s_id", "start", "end", "gsd_id"]
@@ -406,12 +415,7 @@ class TestIsSingleSensorTrajLikeList:
     @pytest.mark.parametrize(
         "value",
         (
-            list(range(6)),
-            "test",
-            np.arange(6),
-            {},
-            pd.DataFrame(),
-            pd.DataFrame(columns=[*range(3)]),
+            *_WRONG_DATATYPES,
             pd.DataFrame(columns=["s_id", "sample", "wrong1", "wrong2"]),
         ),
     )
@@ -429,9 +433,7 @@ class TestIsSingleSensorTrajLikeList:
         ),
     )
     def test_valid_versions(self, cols, index):
-        df = pd.DataFrame(columns=[*self.valid_cols, *cols, *index])
-        if index:
-            df = df.set_index(index)
+        df = _indexed_single_sensor_df((*self.valid_cols, *cols), tuple(index))
 
         assert self.func(df, "stride")
 
@@ -445,10 +447,7 @@ class TestIsSingleSensorTrajLikeList:
         ),
     )
     def test_valid_versions_without_s_id(self, cols, index, both):
-
-        df = pd.DataFrame(columns=[*self.valid_cols, *cols, *index])
-        if index:
-            df = df.set_index(index)
+        df = _indexed_single_sensor_df((*self.valid_cols, *cols), tuple(index))
 
         assert self.func(df, "stride") == both
         assert self.func(df) is True
@@ -487,10 +486,7 @@ class TestIsMultiSensorTrajLikeList:
     def traj_like_lists(self, request):
         self.func, self.dtype, self.valid_cols = request.param
 
-    @pytest.mark.parametrize(
-        "value",
-        (list(range(6)), "test", np.arange(6), {}, pd.DataFrame(), pd.DataFrame(columns=[*range(3)])),
-    )
+    @pytest.mark.parametrize("value", _WRONG_DATATYPES)
     def test_wrong_datatype(self, value):
         assert not self.func(value)
 
@@ -505,9 +501,7 @@ class TestIsMultiSensorTrajLikeList:
         ),
     )
     def test_valid_versions(self, cols, index):
-        df = pd.DataFrame(columns=[*self.valid_cols, *cols, *index])
-        if index:
-            df = df.set_index(index)
+        df = _indexed_single_sensor_df((*self.valid_cols, *cols), tuple(index))
 
         assert self.func({"s1": df}, "stride")
 
@@ -558,46 +552,34 @@ class TestIsTrajLikeList:
 
 
 class TestSetCorrectIndex:
-    def test_no_change_needed(self):
-        index_names = ["t1", "t2"]
-        test = _create_test_multiindex()
-        test = test.rename(index_names)
-        df = pd.DataFrame(range(9), index=test, columns=["c"])
+    index_names = ["t1", "t2"]
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def df(cls):
+        # `set_correct_index` never modifies its input, so one frame can be shared by all tests of the class.
+        return pd.DataFrame(range(9), index=_TEST_MULTIINDEX.rename(cls.index_names), columns=["c"])
 
-        assert_frame_equal(df, set_correct_index(df, index_names))
+    def test_no_change_needed(self, df):
+        assert_frame_equal(df, set_correct_index(df, self.index_names))
 
     @pytest.mark.parametrize("level", (0, 1, [0, 1]))
-    def test_cols_to_index(self, level):
+    def test_cols_to_index(self, df, level):
         """Test what happens if one or multiple of the expected index cols are normal cols."""
-        index_names = ["t1", "t2"]
-        test = _create_test_multiindex()
-        test = test.rename(index_names)
-        df = pd.DataFrame(range(9), index=test, columns=["c"])
-
         reset_df = df.reset_index(level=level)
 
-        out = set_correct_index(reset_df, index_names)
+        out = set_correct_index(reset_df, self.index_names)
 
-        assert out.index.names == index_names
+        assert out.index.names == self.index_names
         # Nothing was changed besides setting the index
         assert_frame_equal(df, out)
 
-    def test_col_does_not_exist(self):
-        index_names = ["t1", "t2"]
-        test = _create_test_multiindex()
-        test = test.rename(index_names)
-        df = pd.DataFrame(range(9), index=test, columns=["c"])
-
+    def test_col_does_not_exist(self, df):
         with pytest.raises(ValidationError):
-            set_correct_index(df, ["does_not_exist", *index_names])
+            set_correct_index(df, ["does_not_exist", *self.index_names])
 
     @pytest.mark.parametrize("drop_additional", (True, False))
-    def test_additional_index_col(self, drop_additional):
-        index_names = ["t1", "t2"]
-        test = _create_test_multiindex()
-        test = test.rename(index_names)
-        df = pd.DataFrame(range(9), index=test, columns=["c"])
-
+    def test_additional_index_col(self, df, drop_additional):
         expected = ["t1", "c"]
         out = set_correct_index(df, expected, drop_false_index_cols=drop_additional)
 
@@ -609,13 +591,8 @@ class TestIsSingleRegionsOfInterestList:
     @pytest.mark.parametrize(
         "value",
         (
-            list(range(6)),
-            "test",
-            np.arange(6),
-            {},
-            pd.DataFrame(),
-            pd.DataFrame(columns=[*range(3)]),
-            pd.DataFrame([[*range(9)]], columns=_create_test_multiindex()),
+            *_WRONG_DATATYPES,
+            pd.DataFrame([[*range(9)]], columns=_TEST_MULTIINDEX),
         ),
     )
     def test_wrong_datatype(self, value):
@@ -633,7 +610,7 @@ class TestIsSingleRegionsOfInterestList:
     def test_valid_versions(self, cols, roi_type_valid, roi_types):
         expected_outcome = roi_types in roi_type_valid or roi_types == "any"
 
-        out = is_single_sensor_regions_of_interest_list(pd.DataFrame(columns=cols), region_type=roi_types)
+        out = is_single_sensor_regions_of_interest_list(_single_sensor_df(tuple(cols)), region_type=roi_types)
 
         assert expected_outcome == out
 
@@ -676,10 +653,7 @@ class TestIsSingleRegionsOfInterestList:
 
 
 class TestIsMultiSensorRegionsOfInterestList:
-    @pytest.mark.parametrize(
-        "value",
-        (list(range(6)), "test", np.arange(6), {}, pd.DataFrame(), pd.DataFrame(columns=[*range(3)])),
-    )
+    @pytest.mark.parametrize("value", _WRONG_DATATYPES)
     def test_wrong_datatype(self, value):
         assert not is_multi_sensor_regions_of_interest_list(value)
 
@@ -695,7 +669,7 @@ class TestIsMultiSensorRegionsOfInterestList:
     def test_valid_versions(self, cols, roi_type_valid, roi_types):
         expected_outcome = roi_types in roi_type_valid or roi_types == "any"
 
-        out = is_multi_sensor_regions_of_interest_list({"s1": pd.DataFrame(columns=cols)}, region_type=roi_types)
+        out = is_multi_sensor_regions_of_interest_list({"s1": _single_sensor_df(tuple(cols))}, region_type=roi_types)
 
         assert expected_outcome == out
 
@@ -329,6 +329,18 @@ class TestGetGravityRotation:
         rotated_vector = rotation_quad.apply(np.array([1, 0, 0]))
         assert_almost_equal(rotated_vector, np.array([0, 0, 1]))
 
+    def test_multiple_gravity_vectors(self):
+        """Test that multiple vectors give the same result as calculating the rotations one by one."""
+        # Includes parallel and antiparallel vectors, which need special handling.
+        gravity_vectors = np.array([[1, 0, 0], [0, 0, 3], [0, 0, -1], [1, 2, 3], [-0.5, 0.2, -4]])
+        rotations = get_gravity_rotation(gravity_vectors)
+
+        assert len(rotations) == len(gravity_vectors)
+        for rot, vec in zip(rotations, gravity_vectors):
+            assert_almost_equal(rot.as_matrix(), get_gravity_rotation(vec).as_matrix())
+        rotated_vectors = rotations.apply(gravity_vectors / np.linalg.norm(gravity_vectors, axis=1)[:, None])
+        assert_almost_equal(rotated_vectors, np.repeat([[0, 0, 1]], len(gravity_vectors), axis=0))
+
 
 class TestFindRotationAroundAxis:
     """Test the function find_rotation_around_axis."""